@@ -5,10 +5,19 @@ This module centralizes all environment-based configuration for the wallet servi
 including database, Google OAuth, Paystack, JWT, and API key settings.
 """
 
-from functools import lru_cache
+import logging
+from functools import cached_property, lru_cache
 
+from pydantic import ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
+
+def _is_placeholder(value: str) -> bool:
+    """Whether a credential is empty or still a "your-..." sample value."""
+    return not value or value.startswith("your-")
+
 
 class Settings(BaseSettings):
     """
@@ -18,7 +27,15 @@ class Settings(BaseSettings):
         DEBUG (bool): Debug mode flag.
         API_V1_PREFIX (str): API version prefix for routes.
         APP_PORT (int): Port for the application to run on.
+        APP_WORKERS (int): Uvicorn worker processes (ignored when DEBUG reloads);
+            each worker has its own database pool and background tasks.
         DATABASE_URL (str): Database connection URL.
+        DB_POOL_SIZE (int): Persistent connections kept in the pool.
+        DB_MAX_OVERFLOW (int): Extra connections allowed above DB_POOL_SIZE under load.
+        DB_POOL_RECYCLE (int): Seconds before a pooled connection is replaced.
+        DB_POOL_PRE_PING (bool): Ping connections on checkout (costs a round-trip).
+        DB_CREATE_TABLES (bool): Run metadata.create_all at startup; turn off once
+            the schema is managed by migrations.
         SECRET_KEY (str): Secret key for JWT encoding/decoding.
         ALGORITHM (str): Algorithm used for JWT.
         ACCESS_TOKEN_EXPIRE_MINUTES (int): JWT token expiration time in minutes.
@@ -31,6 +48,7 @@ class Settings(BaseSettings):
         PAYSTACK_BASE_URL (str): Base URL for Paystack API.
         API_KEY_PREFIX (str): Prefix for generated API keys.
         MAX_API_KEYS_PER_USER (int): Maximum number of API keys allowed per user.
+        AUTH_CACHE_TTL (int): Seconds an authenticated user or API key stays cached.
         FRONTEND_URL (str): URL of the frontend application.
     Examples:
         >>> settings = get_settings()
@@ -47,8 +65,14 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     API_V1_PREFIX: str = "/api/v1"
     APP_PORT: int = 7001
+    APP_WORKERS: int = 1
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 1800  # 30 minutes
+    DB_POOL_PRE_PING: bool = True
+    DB_CREATE_TABLES: bool = True
 
     # JWT
     SECRET_KEY: str
@@ -69,10 +93,82 @@ class Settings(BaseSettings):
     # API Keys
     API_KEY_PREFIX: str = "sk_live_"
     MAX_API_KEYS_PER_USER: int = 5
+    AUTH_CACHE_TTL: int = 60
 
     # Frontend
     FRONTEND_URL: str = "http://localhost:3000"
 
+    @cached_property
+    def paystack_headers(self) -> dict[str, str]:
+        """
+        Paystack API request headers, built once per settings instance.
+
+        Returns:
+            dict[str, str]: Bearer authorization and JSON content type headers.
+
+        Examples:
+            >>> settings.paystack_headers["Content-Type"]
+            'application/json'
+        """
+        return {
+            "Authorization": f"Bearer {self.PAYSTACK_SECRET_KEY}",
+            "Content-Type": "application/json",
+        }
+
+    @cached_property
+    def paystack_callback_url(self) -> str:
+        """
+        Frontend URL Paystack redirects to after checkout.
+
+        Returns:
+            str: Payment callback URL on the frontend.
+
+        Examples:
+            >>> settings.paystack_callback_url
+            'http://localhost:3000/payment/callback'
+        """
+        return f"{self.FRONTEND_URL}/payment/callback"
+
+    @cached_property
+    def google_oauth_configured(self) -> bool:
+        """
+        Whether real Google OAuth credentials are set, checked once per instance.
+
+        Returns:
+            bool: False if the client ID or secret is empty or a placeholder.
+
+        Examples:
+            >>> if not settings.google_oauth_configured:
+            >>>     print("Google sign-in is disabled")
+        """
+        return not (
+            _is_placeholder(self.GOOGLE_CLIENT_ID)
+            or _is_placeholder(self.GOOGLE_CLIENT_SECRET)
+        )
+
+    @field_validator("GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET")
+    @classmethod
+    def validate_google_credentials(cls, value: str, info: ValidationInfo) -> str:
+        """
+        Warn about empty or placeholder Google OAuth credentials.
+
+        Args:
+            value (str): Configured credential value.
+            info (ValidationInfo): Pydantic validation info carrying the field name.
+
+        Returns:
+            str: The credential, unchanged.
+
+        Notes:
+            - Placeholders are allowed so the app still starts from .env.sample;
+              Google sign-in raises until real credentials are set.
+        """
+        if _is_placeholder(value):
+            logger.warning(
+                f"{info.field_name} is not configured; Google sign-in will fail until real credentials are set."
+            )
+        return value
+
 
 @lru_cache
 def get_settings() -> Settings:
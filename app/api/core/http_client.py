@@ -0,0 +1,95 @@
+"""
+Shared outbound HTTP clients.
+
+Provides pooled httpx.AsyncClient instances for Google OAuth and Paystack calls so
+TCP/TLS connections are reused across requests instead of re-handshaking per call.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.api.core.config import get_settings
+
+settings = get_settings()
+
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+_http_client: Optional[httpx.AsyncClient] = None
+_paystack_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Pooled client with keep-alive and HTTP/2 enabled.
+
+    Examples:
+        >>> client = get_http_client()
+        >>> response = await client.get(GoogleAuthService.GOOGLE_USERINFO_URL)
+
+    Notes:
+        - Created eagerly in the app lifespan; lazy creation covers scripts and tests.
+        - Used for Google OAuth; Paystack has its own client (get_paystack_client).
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True, limits=_POOL_LIMITS, timeout=_TIMEOUT
+        )
+
+    return _http_client
+
+
+def get_paystack_client() -> httpx.AsyncClient:
+    """
+    Get the shared Paystack API client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Pooled client with PAYSTACK_BASE_URL as base URL and
+        the secret-key Authorization header preset.
+
+    Examples:
+        >>> client = get_paystack_client()
+        >>> response = await client.get(f"/transaction/verify/{reference}")
+
+    Notes:
+        - Callers pass paths only; auth headers are sent on every request.
+    """
+    global _paystack_client
+
+    if _paystack_client is None or _paystack_client.is_closed:
+        _paystack_client = httpx.AsyncClient(
+            base_url=settings.PAYSTACK_BASE_URL,
+            headers=settings.paystack_headers,
+            http2=True,
+            limits=_POOL_LIMITS,
+            timeout=_TIMEOUT,
+        )
+
+    return _paystack_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP clients and release pooled connections.
+
+    Examples:
+        >>> await close_http_client()
+
+    Notes:
+        - Called from the app lifespan on shutdown.
+    """
+    global _http_client, _paystack_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+    if _paystack_client is not None:
+        await _paystack_client.aclose()
+        _paystack_client = None
@@ -2,7 +2,22 @@
 SQLAlchemy ORM models.
 """
 
-from app.api.models.user import User, Wallet, Transaction, APIKey, IdempotencyKey
+from app.api.models.user import (
+    User,
+    Wallet,
+    Transaction,
+    APIKey,
+    IdempotencyKey,
+    WebhookEvent,
+)
 from app.api.models.base import Base
 
-__all__ = ["User", "Wallet", "Transaction", "APIKey", "IdempotencyKey", "Base"]
+__all__ = [
+    "User",
+    "Wallet",
+    "Transaction",
+    "APIKey",
+    "IdempotencyKey",
+    "WebhookEvent",
+    "Base",
+]
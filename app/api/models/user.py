@@ -6,6 +6,7 @@ This module defines all SQLAlchemy ORM models:
 - Wallet: User wallet with balance and unique wallet number
 - Transaction: Deposit, transfer_in, transfer_out records
 - APIKey: Service-to-service authentication keys
+- WebhookEvent: Inbound webhook events queued for processing
 """
 
 import secrets
@@ -23,6 +24,7 @@ from sqlalchemy import (
     Numeric,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -157,7 +159,21 @@ class Transaction(Base, TimestampMixin):
     wallet = relationship("Wallet", back_populates="transactions")
 
     # Indexes
-    __table_args__ = (Index("idx_wallet_created", "wallet_id", "created_at"),)
+    __table_args__ = (
+        Index("idx_wallet_created", "wallet_id", "created_at", "id"),
+        # Recovery scan only ever looks at recent successful transfer_out rows
+        Index(
+            "idx_transfer_out_success_created",
+            "created_at",
+            postgresql_where=text("type = 'transfer_out' AND status = 'success'"),
+        ),
+        # Stale-deposit sweep; pending rows are few, so this stays tiny
+        Index(
+            "idx_deposit_pending_created",
+            "created_at",
+            postgresql_where=text("type = 'deposit' AND status = 'pending'"),
+        ),
+    )
 
 
 class APIKey(Base, TimestampMixin):
@@ -268,3 +284,44 @@ class IdempotencyKey(Base, TimestampMixin):
     __table_args__ = (
         Index("ix_idempotency_keys_key_operation", "key", "operation"),
     )
+
+
+class WebhookEvent(Base, TimestampMixin):
+    """
+    Model for inbound webhook events, recorded before they are processed.
+
+    Attributes:
+        id (int): Primary key.
+        provider (str): Sender of the webhook ('paystack').
+        event_id (str): Provider-side identity of the event (unique per provider).
+        event (str): Event type, e.g. 'charge.success'.
+        payload (dict): Full webhook body (JSON).
+        processed_at (datetime): When the event was applied; None while queued.
+
+    Examples:
+        >>> event = WebhookEvent(
+        >>>     provider="paystack",
+        >>>     event_id="charge.success:DEP_123",
+        >>>     event="charge.success",
+        >>>     payload=data,
+        >>> )
+    """
+
+    __tablename__ = "webhook_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider = Column(String(50), nullable=False)
+    event_id = Column(String(255), nullable=False)
+    event = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("provider", "event_id", name="uq_webhook_provider_event"),
+        # The sweeper only ever scans the unprocessed backlog
+        Index(
+            "idx_webhook_events_unprocessed",
+            "id",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
@@ -9,7 +9,7 @@ Endpoints:
 """
 
 from fastapi import APIRouter, Depends, Path, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.database import get_db
 from app.api.models.user import APIKey, User
@@ -36,7 +36,7 @@ router = APIRouter(prefix="/keys", tags=["API Keys"])
 async def create_api_key(
     request: APIKeyCreateRequest,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create a new API key with specific permissions.
@@ -44,7 +44,7 @@ async def create_api_key(
     Args:
         request (APIKeyCreateRequest): Key creation request with name, permissions, expiry.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with API key details.
@@ -62,7 +62,7 @@ async def create_api_key(
     user, _ = auth
 
     try:
-        api_key, plain_key = APIKeyService.create_api_key(
+        api_key, plain_key = await APIKeyService.create_api_key(
             db=db,
             user_id=user.id,
             name=request.name,
@@ -96,7 +96,7 @@ async def create_api_key(
 async def rollover_api_key(
     request: APIKeyRolloverRequest,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create new API key from an expired key with same permissions.
@@ -104,7 +104,7 @@ async def rollover_api_key(
     Args:
         request (APIKeyRolloverRequest): Rollover request with expired key ID and new expiry.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with new API key details.
@@ -120,7 +120,7 @@ async def rollover_api_key(
     user, _ = auth
 
     try:
-        new_key, plain_key = APIKeyService.rollover_expired_key(
+        new_key, plain_key = await APIKeyService.rollover_expired_key(
             db=db,
             expired_key_id=request.expired_key_id,
             user_id=user.id,
@@ -152,14 +152,14 @@ async def rollover_api_key(
 @router.get("", responses=list_api_keys_responses)
 async def list_api_keys(
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     List all API keys for authenticated user.
 
     Args:
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with list of API keys.
@@ -167,7 +167,7 @@ async def list_api_keys(
     """
     user, _ = auth
 
-    keys = APIKeyService.list_user_keys(db, user.id)
+    keys = await APIKeyService.list_user_keys(db, user.id)
 
     keys_data = [
         {
@@ -192,7 +192,7 @@ async def list_api_keys(
 async def revoke_api_key(
     key_id: int = Path(..., description="API key ID to revoke"),
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Revoke an API key.
@@ -200,7 +200,7 @@ async def revoke_api_key(
     Args:
         key_id (int): ID of API key to revoke.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response confirming revocation.
@@ -215,7 +215,7 @@ async def revoke_api_key(
     """
     user, _ = auth
 
-    success = APIKeyService.revoke_api_key(db, key_id, user.id)
+    success = await APIKeyService.revoke_api_key(db, key_id, user.id)
 
     if not success:
         return error_response(
@@ -8,7 +8,7 @@ Endpoints:
 
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.config import get_settings
 from app.api.core.database import get_db
@@ -44,7 +44,7 @@ async def google_login():
 @router.get("/google/callback", responses=google_callback_responses)
 async def google_callback(
     code: str = Query(..., description="Authorization code from Google"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Handle Google OAuth callback.
@@ -53,7 +53,7 @@ async def google_callback(
 
     Args:
         code (str): Authorization code from Google.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Standard auth response with JWT token and user data.
@@ -85,7 +85,7 @@ async def google_callback(
             name=user_info.get("name", user_info["email"]),
         )
 
-        user = GoogleAuthService.get_or_create_user(db, user_data)
+        user = await GoogleAuthService.get_or_create_user(db, user_data)
 
         jwt_token = create_access_token(data={"sub": user.email, "user_id": user.id})
 
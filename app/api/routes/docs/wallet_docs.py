@@ -602,6 +602,7 @@ get_transaction_history_responses = {
                                     },
                                 ],
                                 "total": 2,
+                                "next_cursor": None,
                             },
                         },
                     }
@@ -11,9 +11,10 @@ Endpoints:
 - GET /wallet/transactions: Get transaction history
 """
 
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.database import get_db
 from app.api.models.user import APIKey, User
@@ -26,7 +27,9 @@ from app.api.schemas.wallet import (
     UserDetailsResponse,
 )
 from app.api.services.wallet_service import WalletService
+from app.api.services.webhook_service import WebhookService
 from app.api.utils.auth_middleware import get_current_user, require_permission
+from app.api.utils.background_tasks import process_webhook_event
 from app.api.utils.response_payload import error_response, success_response
 from app.api.utils.security import verify_paystack_signature
 from app.api.routes.docs.wallet_docs import (
@@ -46,14 +49,14 @@ router = APIRouter(prefix="/wallet", tags=["Wallet"])
 async def get_user_details(
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("read")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get authenticated user's profile and wallet details.
 
     Args:
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: User profile with wallet information.
@@ -65,7 +68,7 @@ async def get_user_details(
     """
     user, _ = auth
 
-    wallet = WalletService.get_wallet_by_user_id(db, user.id)
+    wallet = await WalletService.get_wallet_by_user_id(db, user.id)
 
     if not wallet:
         return error_response(
@@ -93,7 +96,7 @@ async def deposit_funds(
     request: DepositRequest,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("deposit")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Initialize a Paystack deposit transaction.
@@ -101,7 +104,7 @@ async def deposit_funds(
     Args:
         request (DepositRequest): Deposit amount.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with Paystack payment URL.
@@ -116,7 +119,7 @@ async def deposit_funds(
     """
     user, _ = auth
 
-    wallet = WalletService.get_wallet_by_user_id(db, user.id)
+    wallet = await WalletService.get_wallet_by_user_id(db, user.id)
 
     if not wallet:
         return error_response(
@@ -126,7 +129,7 @@ async def deposit_funds(
         )
 
     try:
-        result = WalletService.initialize_paystack_deposit(
+        result = await WalletService.initialize_paystack_deposit(
             db=db,
             wallet=wallet,
             amount=request.amount,
@@ -151,16 +154,18 @@ async def deposit_funds(
 @router.post("/paystack/webhook", responses=paystack_webhook_responses)
 async def paystack_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     x_paystack_signature: str = Header(..., alias="x-paystack-signature"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Handle Paystack webhook events (MANDATORY for wallet credits).
 
     Args:
         request (Request): Raw FastAPI request object.
+        background_tasks (BackgroundTasks): Runs the credit after the response.
         x_paystack_signature (str): Paystack signature header for verification.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Simple success confirmation for Paystack.
@@ -171,6 +176,8 @@ async def paystack_webhook(
         - Idempotent: won't double-credit if webhook is resent.
         - Only "charge.success" events credit wallets.
         - This is the ONLY endpoint that should credit wallets for deposits.
+        - Events are recorded and acknowledged straight away; the wallet is
+          credited after the response, so Paystack never waits on wallet locks.
     """
     # Get raw request body for signature verification
     body = await request.body()
@@ -187,12 +194,14 @@ async def paystack_webhook(
     data = await request.json()
     event = data.get("event")
 
-    # Only process successful charge events
+    # Only successful charge events are queued; redeliveries are dropped here
     if event == "charge.success":
         reference = data["data"]["reference"]
-
-        # Process the deposit (idempotent)
-        WalletService.process_successful_deposit(db, reference)
+        event_pk = await WebhookService.record_event(
+            db, "paystack", f"{event}:{reference}", event, data
+        )
+        if event_pk is not None:
+            background_tasks.add_task(process_webhook_event, event_pk)
 
     return success_response(
         status_code=status.HTTP_200_OK,
@@ -206,7 +215,7 @@ async def verify_deposit_with_paystack(
     reference: str,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("deposit")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Manually verify a deposit transaction with Paystack and update status.
@@ -214,7 +223,7 @@ async def verify_deposit_with_paystack(
     Args:
         reference (str): Transaction reference from your system.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Transaction status from Paystack.
@@ -230,7 +239,7 @@ async def verify_deposit_with_paystack(
     user, _ = auth
 
     # Get transaction from database
-    transaction = WalletService.get_transaction_by_reference(db, reference)
+    transaction = await WalletService.get_transaction_by_reference(db, reference)
 
     if not transaction:
         return error_response(
@@ -241,12 +250,12 @@ async def verify_deposit_with_paystack(
 
     # Verify with Paystack
     try:
-        paystack_status = WalletService.verify_paystack_transaction(reference)
+        paystack_status = await WalletService.verify_paystack_transaction(reference)
 
         # If Paystack says success and our record is pending, process it
         if paystack_status["status"] == "success" and transaction.status == "pending":
-            WalletService.process_successful_deposit(db, reference)
-            transaction = WalletService.get_transaction_by_reference(db, reference)
+            await WalletService.process_successful_deposit(db, reference)
+            await db.refresh(transaction)
 
         return success_response(
             status_code=status.HTTP_200_OK,
@@ -271,7 +280,7 @@ async def check_deposit_status(
     reference: str,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("read")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Check status of a deposit transaction (manual verification).
@@ -279,7 +288,7 @@ async def check_deposit_status(
     Args:
         reference (str): Transaction reference.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with transaction status.
@@ -294,7 +303,7 @@ async def check_deposit_status(
     """
     user, _ = auth
 
-    wallet = WalletService.get_wallet_by_user_id(db, user.id)
+    wallet = await WalletService.get_wallet_by_user_id(db, user.id)
 
     if not wallet:
         return error_response(
@@ -303,7 +312,7 @@ async def check_deposit_status(
             error="WALLET_NOT_FOUND",
         )
 
-    transaction = WalletService.get_transaction_by_reference(db, reference)
+    transaction = await WalletService.get_transaction_by_reference(db, reference)
 
     if not transaction or transaction.wallet_id != wallet.id:
         return error_response(
@@ -330,14 +339,14 @@ async def check_deposit_status(
 async def get_wallet_balance(
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("read")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get current wallet balance.
 
     Args:
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with wallet balance.
@@ -352,7 +361,7 @@ async def get_wallet_balance(
     """
     user, _ = auth
 
-    wallet = WalletService.get_wallet_by_user_id(db, user.id)
+    wallet = await WalletService.get_wallet_by_user_id(db, user.id)
 
     if not wallet:
         return error_response(
@@ -378,7 +387,7 @@ async def transfer_funds(
     request: TransferRequest,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("transfer")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Transfer funds to another wallet.
@@ -386,7 +395,7 @@ async def transfer_funds(
     Args:
         request (TransferRequest): Transfer details (wallet_number, amount, idempotency_key(optional for now)).
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with transfer confirmation.
@@ -402,7 +411,7 @@ async def transfer_funds(
     """
     user, _ = auth
 
-    sender_wallet = WalletService.get_wallet_by_user_id(db, user.id)
+    sender_wallet = await WalletService.get_wallet_by_user_id(db, user.id)
 
     if not sender_wallet:
         return error_response(
@@ -412,7 +421,7 @@ async def transfer_funds(
         )
 
     try:
-        result = WalletService.transfer_funds(
+        result = await WalletService.transfer_funds(
             db=db,
             sender_wallet=sender_wallet,
             recipient_wallet_number=request.wallet_number,
@@ -437,33 +446,34 @@ async def transfer_funds(
 
 @router.get("/transactions", responses=get_transaction_history_responses)
 async def get_transaction_history(
+    cursor: Optional[str] = None,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("read")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get transaction history for user's wallet.
 
     Args:
+        cursor (Optional[str]): next_cursor from the previous page, if any.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Success response with list of transactions.
 
     Raises:
-        HTTPException: 404 if wallet not found.
-
-
+        HTTPException: 400 if cursor is malformed, 404 if wallet not found.
 
     Notes:
         - Returns transactions ordered by most recent first.
-        - Limited to 50 transactions per request.
+        - Limited to 50 transactions per request; pass next_cursor back as
+          ?cursor= to fetch the next page.
         - Requires 'read' permission if using API key.
     """
     user, _ = auth
 
-    wallet = WalletService.get_wallet_by_user_id(db, user.id)
+    wallet = await WalletService.get_wallet_by_user_id(db, user.id)
 
     if not wallet:
         return error_response(
@@ -472,14 +482,35 @@ async def get_transaction_history(
             error="WALLET_NOT_FOUND",
         )
 
-    transactions = WalletService.get_transactions(db, wallet.id, limit=50)
+    page_cursor = None
+    if cursor:
+        try:
+            page_cursor = WalletService.decode_transactions_cursor(cursor)
+        except (ValueError, OverflowError):
+            return error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid pagination cursor",
+                error="INVALID_CURSOR",
+            )
+
+    transactions, next_cursor = await WalletService.get_transactions(
+        db, wallet.id, limit=50, cursor=page_cursor
+    )
 
     transactions_data = [TransactionResponse.from_orm(txn) for txn in transactions]
 
     return success_response(
         status_code=status.HTTP_200_OK,
         message="Transaction history retrieved",
-        data={"transactions": transactions_data, "total": len(transactions_data)},
+        data={
+            "transactions": transactions_data,
+            "total": len(transactions_data),
+            "next_cursor": (
+                WalletService.encode_transactions_cursor(next_cursor)
+                if next_cursor
+                else None
+            ),
+        },
     )
 
 
@@ -488,7 +519,7 @@ async def recover_failed_transfer(
     request: RecoverTransferRequest,
     auth: tuple[User, APIKey | None] = Depends(get_current_user),
     _: None = Depends(require_permission("transfer")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Recover a failed transfer operation.
@@ -499,7 +530,7 @@ async def recover_failed_transfer(
     Args:
         request (RecoverTransferRequest): Recovery request with transfer reference.
         auth (tuple): Authenticated user and optional API key.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         JSONResponse: Recovery result with success status and recovery outcome.
@@ -514,7 +545,7 @@ async def recover_failed_transfer(
         - Background tasks also perform automatic recovery.
     """
     try:
-        recovered = WalletService.recover_failed_transfer(db, request.reference)
+        recovered = await WalletService.recover_failed_transfer(db, request.reference)
 
         return success_response(
             status_code=status.HTTP_200_OK,
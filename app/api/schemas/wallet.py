@@ -192,11 +192,13 @@ class TransactionHistoryResponse(BaseModel):
 
     Attributes:
         transactions (List[TransactionResponse]): List of user transactions.
-        total (int): Total number of transactions.
+        total (int): Number of transactions in this page.
+        next_cursor (Optional[str]): Cursor for the next page, or None on the last page.
     """
 
     transactions: List[TransactionResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class DepositStatusResponse(BaseModel):
@@ -11,11 +11,13 @@ Handles:
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.api.core.config import get_settings
 from app.api.models.user import APIKey
+from app.api.utils.auth_cache import invalidate_api_key
 from app.api.utils.security import (
     generate_api_key,
     hash_api_key,
@@ -24,49 +26,62 @@ from app.api.utils.security import (
 
 settings = get_settings()
 
+# Built once so every authenticated request reuses its cached compiled form;
+# the owner is joined in because auth needs it straight after
+_API_KEY_BY_HASH = (
+    select(APIKey)
+    .options(joinedload(APIKey.user))
+    .where(APIKey.key_hash == bindparam("key_hash"))
+)
+
 
 class APIKeyService:
     """Service for managing API keys."""
 
     @staticmethod
-    def count_active_keys(db: Session, user_id: int) -> int:
+    async def count_active_keys(db: AsyncSession, user_id: int) -> int:
         """
         Count active (non-expired, non-revoked) API keys for a user.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             user_id (int): User ID.
 
         Returns:
-            int: Number of active API keys.
+            int: Number of active API keys, capped at MAX_API_KEYS_PER_USER + 1.
 
         Examples:
-            >>> count = APIKeyService.count_active_keys(db, user_id=1)
+            >>> count = await APIKeyService.count_active_keys(db, user_id=1)
             >>> print(count)
             3
+
+        Notes:
+            - Only the limit check needs the count, so the scan stops after
+              MAX_API_KEYS_PER_USER + 1 matching rows.
         """
-        now = datetime.now(timezone.utc)
-        return (
-            db.query(APIKey)
-            .filter(
+        active_ids = (
+            select(APIKey.id)
+            .where(
                 and_(
                     APIKey.user_id == user_id,
                     APIKey.is_revoked == False,
-                    APIKey.expires_at > now,
+                    APIKey.expires_at > func.now(),
                 )
             )
-            .count()
+            .limit(settings.MAX_API_KEYS_PER_USER + 1)
+            .subquery()
         )
+        return await db.scalar(select(func.count()).select_from(active_ids))
 
     @staticmethod
-    def create_api_key(
-        db: Session, user_id: int, name: str, permissions: List[str], expiry: str
+    async def create_api_key(
+        db: AsyncSession, user_id: int, name: str, permissions: List[str], expiry: str
     ) -> tuple[APIKey, str]:
         """
         Create a new API key for a user.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             user_id (int): User ID.
             name (str): Human-readable key name.
             permissions (List[str]): List of permissions: ['deposit', 'transfer', 'read'].
@@ -79,7 +94,7 @@ class APIKeyService:
             ValueError: If user has reached maximum API key limit.
 
         Examples:
-            >>> api_key, plain_key = APIKeyService.create_api_key(
+            >>> api_key, plain_key = await APIKeyService.create_api_key(
             >>>     db, user_id=1, name="trading-bot",
             >>>     permissions=["read", "deposit"], expiry="1M"
             >>> )
@@ -90,9 +105,10 @@ class APIKeyService:
             - Returns plain text key only once (not stored).
             - Only hashed version is stored in database.
             - User can have maximum 5 active keys.
+            - Returned APIKey is detached; id and created_at come from INSERT ... RETURNING.
         """
         # Check key limit
-        active_count = APIKeyService.count_active_keys(db, user_id)
+        active_count = await APIKeyService.count_active_keys(db, user_id)
         if active_count >= settings.MAX_API_KEYS_PER_USER:
             raise ValueError(
                 f"Maximum {settings.MAX_API_KEYS_PER_USER} active API keys allowed per user"
@@ -105,36 +121,43 @@ class APIKeyService:
         # Parse expiry
         expires_at = parse_expiry_to_datetime(expiry)
 
-        # Create API key record
-        api_key = APIKey(
-            user_id=user_id,
-            key_hash=key_hash,
-            name=name,
-            permissions=permissions,
-            expires_at=expires_at,
-            is_revoked=False,
+        # Create API key record, reading generated columns back via RETURNING
+        values = {
+            "user_id": user_id,
+            "key_hash": key_hash,
+            "name": name,
+            "permissions": permissions,
+            "expires_at": expires_at,
+            "is_revoked": False,
+        }
+        result = await db.execute(
+            insert(APIKey).values(**values).returning(APIKey.id, APIKey.created_at)
         )
+        row = result.one()
+        await db.commit()
 
-        db.add(api_key)
-        db.commit()
-        db.refresh(api_key)
+        api_key = APIKey(**values)
+        api_key.id, api_key.created_at = row
 
         return api_key, plain_key
 
     @staticmethod
-    def get_api_key_by_value(db: Session, plain_key: str) -> Optional[APIKey]:
+    async def get_api_key_by_value(
+        db: AsyncSession, plain_key: str, key_hash: Optional[str] = None
+    ) -> Optional[APIKey]:
         """
         Retrieve API key by its plain text value.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             plain_key (str): Plain text API key from request.
+            key_hash (Optional[str]): hash_api_key(plain_key), if already computed.
 
         Returns:
-            Optional[APIKey]: API key object or None if not found.
+            Optional[APIKey]: API key object (with user loaded) or None if not found.
 
         Examples:
-            >>> api_key = APIKeyService.get_api_key_by_value(db, "sk_live_abc123")
+            >>> api_key = await APIKeyService.get_api_key_by_value(db, "sk_live_abc123")
             >>> if api_key and api_key.is_valid():
             >>>     print("Valid key")
 
@@ -142,27 +165,31 @@ class APIKeyService:
             - Compares hash of plain_key with stored hashes.
             - Use constant-time comparison to prevent timing attacks.
         """
-        key_hash = hash_api_key(plain_key)
-        return db.query(APIKey).filter(APIKey.key_hash == key_hash).first()
+        if key_hash is None:
+            key_hash = hash_api_key(plain_key)
+        return await db.scalar(_API_KEY_BY_HASH, {"key_hash": key_hash})
 
     @staticmethod
-    def validate_api_key(db: Session, plain_key: str) -> Optional[APIKey]:
+    async def validate_api_key(
+        db: AsyncSession, plain_key: str, key_hash: Optional[str] = None
+    ) -> Optional[APIKey]:
         """
         Validate API key and check if it's active.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             plain_key (str): Plain text API key from request.
+            key_hash (Optional[str]): hash_api_key(plain_key), if already computed.
 
         Returns:
             Optional[APIKey]: Valid API key or None if invalid/expired/revoked.
 
         Examples:
-            >>> api_key = APIKeyService.validate_api_key(db, request_key)
+            >>> api_key = await APIKeyService.validate_api_key(db, request_key)
             >>> if not api_key:
             >>>     raise HTTPException(status_code=401, detail="Invalid API key")
         """
-        api_key = APIKeyService.get_api_key_by_value(db, plain_key)
+        api_key = await APIKeyService.get_api_key_by_value(db, plain_key, key_hash)
 
         if not api_key:
             return None
@@ -173,12 +200,12 @@ class APIKeyService:
         return api_key
 
     @staticmethod
-    def revoke_api_key(db: Session, key_id: int, user_id: int) -> bool:
+    async def revoke_api_key(db: AsyncSession, key_id: int, user_id: int) -> bool:
         """
         Revoke an API key.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             key_id (int): API key ID to revoke.
             user_id (int): User ID (for authorization check).
 
@@ -186,32 +213,31 @@ class APIKeyService:
             bool: True if revoked successfully, False if not found or unauthorized.
 
         Examples:
-            >>> success = APIKeyService.revoke_api_key(db, key_id=5, user_id=1)
+            >>> success = await APIKeyService.revoke_api_key(db, key_id=5, user_id=1)
             >>> print(success)
             True
         """
-        api_key = (
-            db.query(APIKey)
-            .filter(and_(APIKey.id == key_id, APIKey.user_id == user_id))
-            .first()
+        api_key = await db.scalar(
+            select(APIKey).where(and_(APIKey.id == key_id, APIKey.user_id == user_id))
         )
 
         if not api_key:
             return False
 
         api_key.is_revoked = True
-        db.commit()
+        await db.commit()
+        invalidate_api_key(api_key.key_hash)
         return True
 
     @staticmethod
-    def rollover_expired_key(
-        db: Session, expired_key_id: int, user_id: int, new_expiry: str
+    async def rollover_expired_key(
+        db: AsyncSession, expired_key_id: int, user_id: int, new_expiry: str
     ) -> tuple[APIKey, str]:
         """
         Create new API key using permissions from an expired key.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             expired_key_id (int): ID of expired key to rollover.
             user_id (int): User ID (for authorization check).
             new_expiry (str): New expiry format: "1H", "1D", "1M", "1Y".
@@ -223,7 +249,7 @@ class APIKeyService:
             ValueError: If key not found, not expired, or not owned by user.
 
         Examples:
-            >>> new_key, plain_key = APIKeyService.rollover_expired_key(
+            >>> new_key, plain_key = await APIKeyService.rollover_expired_key(
             >>>     db, expired_key_id=3, user_id=1, new_expiry="1M"
             >>> )
             >>> print(new_key.permissions)
@@ -235,10 +261,10 @@ class APIKeyService:
             - Old key remains in database but is marked revoked.
         """
         # Get expired key
-        expired_key = (
-            db.query(APIKey)
-            .filter(and_(APIKey.id == expired_key_id, APIKey.user_id == user_id))
-            .first()
+        expired_key = await db.scalar(
+            select(APIKey).where(
+                and_(APIKey.id == expired_key_id, APIKey.user_id == user_id)
+            )
         )
 
         if not expired_key:
@@ -254,7 +280,7 @@ class APIKeyService:
             expired_key.is_revoked = True
 
         # Create new key with same permissions
-        new_key, plain_key = APIKeyService.create_api_key(
+        new_key, plain_key = await APIKeyService.create_api_key(
             db=db,
             user_id=user_id,
             name=expired_key.name,
@@ -262,32 +288,33 @@ class APIKeyService:
             expiry=new_expiry,
         )
 
-        db.commit()
+        await db.commit()
+        invalidate_api_key(expired_key.key_hash)
         return new_key, plain_key
 
     @staticmethod
-    def list_user_keys(db: Session, user_id: int) -> List[APIKey]:
+    async def list_user_keys(db: AsyncSession, user_id: int) -> List[APIKey]:
         """
         List all API keys for a user.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             user_id (int): User ID.
 
         Returns:
             List[APIKey]: List of user's API keys.
 
         Examples:
-            >>> keys = APIKeyService.list_user_keys(db, user_id=1)
+            >>> keys = await APIKeyService.list_user_keys(db, user_id=1)
             >>> for key in keys:
             >>>     print(f"{key.name}: {'active' if key.is_valid() else 'inactive'}")
         """
-        return (
-            db.query(APIKey)
-            .filter(APIKey.user_id == user_id)
+        result = await db.scalars(
+            select(APIKey)
+            .where(APIKey.user_id == user_id)
             .order_by(APIKey.created_at.desc())
-            .all()
         )
+        return result.all()
 
     @staticmethod
     def check_permission(api_key: APIKey, required_permission: str) -> bool:
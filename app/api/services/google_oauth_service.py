@@ -10,10 +10,13 @@ Handles Google sign-in flow:
 from typing import Dict, Optional
 from urllib.parse import urlencode
 
-import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.api.core.config import get_settings
+from app.api.core.http_client import get_http_client
 from app.api.models.user import User, Wallet
 from app.api.schemas.auth import UserCreate
 
@@ -27,6 +30,17 @@ class GoogleAuthService:
     GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
     GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 
+    # Settings are fixed for the process lifetime, so the query string is built once
+    _STATIC_PARAMS: tuple[tuple[str, str], ...] = (
+        ("client_id", settings.GOOGLE_CLIENT_ID),
+        ("redirect_uri", settings.GOOGLE_REDIRECT_URI),
+        ("response_type", "code"),
+        ("scope", "openid email profile"),
+        ("access_type", "offline"),
+        ("prompt", "consent"),
+    )
+    _AUTHORIZATION_URL = f"{GOOGLE_AUTH_URL}?{urlencode(_STATIC_PARAMS)}"
+
     @staticmethod
     def get_authorization_url(state: Optional[str] = None) -> str:
         """
@@ -42,36 +56,23 @@ class GoogleAuthService:
             >>> url = GoogleAuthService.get_authorization_url()
             >>> print(url.startswith("https://accounts.google.com"))
             True
+
+        Raises:
+            ValueError: If Google OAuth credentials are not configured.
+
+        Notes:
+            - The credential check is computed once per settings instance; each
+              call only reads the cached flag.
         """
-        # Validate Google credentials
-        if (
-            not settings.GOOGLE_CLIENT_ID
-            or settings.GOOGLE_CLIENT_ID
-            in (
-                "your-google-client-id.apps.googleusercontent.com",
-                "your-client-id.apps.googleusercontent.com",
-            )
-            or settings.GOOGLE_CLIENT_ID.startswith("your-")
-        ):
+        if not settings.google_oauth_configured:
             raise ValueError(
-                "GOOGLE_CLIENT_ID is not configured. Please set your real Google OAuth client ID in .env or environment variables."
+                "Google OAuth is not configured. Please set your real Google OAuth credentials in .env or environment variables."
             )
 
-        params = {
-            "client_id": settings.GOOGLE_CLIENT_ID,
-            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-            "response_type": "code",
-            "scope": "openid email profile",
-            "access_type": "offline",
-            "prompt": "consent",
-        }
-
         if state:
-            params["state"] = state
+            return f"{GoogleAuthService._AUTHORIZATION_URL}&{urlencode({'state': state})}"
 
-        # Use URL encoding for safety
-        query_string = urlencode(params)
-        return f"{GoogleAuthService.GOOGLE_AUTH_URL}?{query_string}"
+        return GoogleAuthService._AUTHORIZATION_URL
 
     @staticmethod
     async def exchange_code_for_token(code: str) -> Dict[str, str]:
@@ -85,6 +86,7 @@ class GoogleAuthService:
             Dict[str, str]: Token response containing access_token.
 
         Raises:
+            ValueError: If Google OAuth credentials are not configured.
             httpx.HTTPStatusError: If token exchange fails.
 
         Examples:
@@ -92,18 +94,9 @@ class GoogleAuthService:
             >>> print("access_token" in token_data)
             True
         """
-        # Validate credentials
-        if (
-            not settings.GOOGLE_CLIENT_SECRET
-            or settings.GOOGLE_CLIENT_SECRET
-            in (
-                "your-google-client-secret",
-                "your-client-secret",
-            )
-            or settings.GOOGLE_CLIENT_SECRET.startswith("your-")
-        ):
+        if not settings.google_oauth_configured:
             raise ValueError(
-                "GOOGLE_CLIENT_SECRET is not configured. Please set your real Google OAuth client secret in .env or environment variables."
+                "Google OAuth is not configured. Please set your real Google OAuth credentials in .env or environment variables."
             )
 
         data = {
@@ -114,10 +107,11 @@ class GoogleAuthService:
             "grant_type": "authorization_code",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(GoogleAuthService.GOOGLE_TOKEN_URL, data=data)
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().post(
+            GoogleAuthService.GOOGLE_TOKEN_URL, data=data
+        )
+        response.raise_for_status()
+        return response.json()
 
     @staticmethod
     async def get_user_info(access_token: str) -> Dict[str, str]:
@@ -140,20 +134,19 @@ class GoogleAuthService:
         """
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                GoogleAuthService.GOOGLE_USERINFO_URL, headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().get(
+            GoogleAuthService.GOOGLE_USERINFO_URL, headers=headers
+        )
+        response.raise_for_status()
+        return response.json()
 
     @staticmethod
-    def get_or_create_user(db: Session, user_data: UserCreate) -> User:
+    async def get_or_create_user(db: AsyncSession, user_data: UserCreate) -> User:
         """
         Get existing user or create new user with wallet.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             user_data (UserCreate): User creation data from Google.
 
         Returns:
@@ -161,40 +154,59 @@ class GoogleAuthService:
 
         Examples:
             >>> user_data = UserCreate(email="john@example.com", google_id="123", name="John")
-            >>> user = GoogleAuthService.get_or_create_user(db, user_data)
+            >>> user = await GoogleAuthService.get_or_create_user(db, user_data)
             >>> print(user.wallet.balance)
             0.00
 
         Notes:
             - Creates wallet automatically for new users.
             - Wallet number is a unique 13-digit string.
+            - Inserts use ON CONFLICT DO NOTHING, so concurrent sign-ins and
+              wallet number collisions are resolved without a pre-check SELECT.
+            - User and wallet are fetched in one joined SELECT.
         """
-        user = db.query(User).filter(User.google_id == user_data.google_id).first()
+        # Wallet is joined in: callers read user.wallet and async can't lazy-load
+        user_by_google_id = (
+            select(User)
+            .options(joinedload(User.wallet))
+            .where(User.google_id == user_data.google_id)
+        )
+        user = await db.scalar(user_by_google_id)
 
         if user:
             return user
 
-        wallet_number = Wallet.generate_wallet_number()
-        while db.query(Wallet).filter(Wallet.wallet_number == wallet_number).first():
-            wallet_number = Wallet.generate_wallet_number()
-
-        new_user = User(
-            email=user_data.email,
-            google_id=user_data.google_id,
-            name=user_data.name,
-        )
-
-        db.add(new_user)
-        db.flush() 
-
-        wallet = Wallet(
-            user_id=new_user.id,
-            wallet_number=wallet_number,
-            balance=0.00,
+        result = await db.execute(
+            insert(User)
+            .values(
+                email=user_data.email,
+                google_id=user_data.google_id,
+                name=user_data.name,
+            )
+            .on_conflict_do_nothing(index_elements=[User.google_id])
+            .returning(User.id)
         )
+        user_id = result.scalar()
+
+        # A concurrent sign-in created the user first
+        if user_id is None:
+            return (await db.execute(user_by_google_id)).scalar_one()
+
+        # Retry only on the (very unlikely) wallet number collision
+        wallet_id = None
+        while wallet_id is None:
+            result = await db.execute(
+                insert(Wallet)
+                .values(
+                    user_id=user_id,
+                    wallet_number=Wallet.generate_wallet_number(),
+                    balance=0.00,
+                )
+                .on_conflict_do_nothing(index_elements=[Wallet.wallet_number])
+                .returning(Wallet.id)
+            )
+            wallet_id = result.scalar()
 
-        db.add(wallet)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
 
-        return new_user
+        return await db.scalar(user_by_google_id)
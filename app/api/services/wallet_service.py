@@ -8,58 +8,206 @@ Handles:
 - Transaction history
 """
 
-import secrets
-from datetime import datetime, timezone
+import os
+import time
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
-
-import httpx
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Sequence
+
+from cachetools import TTLCache
+from sqlalchemy import (
+    JSON,
+    Integer,
+    Numeric,
+    Row,
+    bindparam,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.api.core.config import get_settings
+from app.api.core.http_client import get_paystack_client
 from app.api.models.user import IdempotencyKey, Transaction, Wallet
 
 settings = get_settings()
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Transaction.id is a 32-bit INTEGER column
+_MAX_TRANSACTION_ID = 2**31 - 1
+
+# Crockford base32, two characters (10 bits) per lookup; 13 pairs cover a 128-bit ULID
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_CROCKFORD_PAIRS = [a + b for a in _CROCKFORD for b in _CROCKFORD]
+_ULID_SHIFTS = tuple(range(120, -1, -10))
+
+# Hot-path lookups built once: a prebuilt statement memoizes its cache key, so
+# per call SQLAlchemy skips statement construction and goes straight to the
+# engine's compiled cache
+_WALLET_BY_USER_ID = select(Wallet).where(Wallet.user_id == bindparam("user_id"))
+_WALLET_BY_NUMBER = select(Wallet).where(
+    Wallet.wallet_number == bindparam("wallet_number")
+)
+_TRANSACTION_BY_REFERENCE = select(Transaction).where(
+    Transaction.reference == bindparam("reference")
+)
+
+# user_id -> wallet_id; wallets are 1:1 with users and never reassigned, so
+# repeat lookups become primary-key gets that the identity map can satisfy
+_wallet_ids_by_user_id: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
+def _merged_extra_data(**fields):
+    """
+    SQL expression for extra_data with fields merged in on the server.
+
+    Args:
+        **fields: Keys to set in the JSON object.
+
+    Returns:
+        ColumnElement: Value for an UPDATE ... SET extra_data = ...
+
+    Examples:
+        >>> update(Transaction).values(
+        >>>     extra_data=_merged_extra_data(failure_reason="timeout")
+        >>> )
+
+    Notes:
+        - extra_data is a json column, so the merge goes through jsonb (||) and
+          is cast back; NULL is treated as an empty object.
+    """
+    return cast(
+        func.coalesce(cast(Transaction.extra_data, JSONB), literal({}, JSONB)).op(
+            "||"
+        )(literal(fields, JSONB)),
+        JSON,
+    )
+
 
 class WalletService:
     """Service for wallet operations and Paystack integration."""
 
+    # Columns served by transaction history (matches TransactionResponse)
+    TRANSACTION_HISTORY_COLUMNS = (
+        Transaction.id,
+        Transaction.type,
+        Transaction.amount,
+        Transaction.status,
+        Transaction.reference,
+        Transaction.extra_data,
+        Transaction.created_at,
+    )
+
     @staticmethod
-    def get_wallet_by_user_id(db: Session, user_id: int) -> Optional[Wallet]:
+    async def get_wallet_by_user_id(
+        db: AsyncSession, user_id: int
+    ) -> Optional[Wallet]:
         """
         Get wallet for a specific user.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             user_id (int): User ID.
 
         Returns:
             Optional[Wallet]: User's wallet or None if not found.
 
         Examples:
-            >>> wallet = WalletService.get_wallet_by_user_id(db, user_id=1)
+            >>> wallet = await WalletService.get_wallet_by_user_id(db, user_id=1)
             >>> print(wallet.balance)
             5000.00
+
+        Notes:
+            - The wallet ID is cached per user, so after the first call this is
+              a Session.get() by primary key.
         """
-        return db.query(Wallet).filter(Wallet.user_id == user_id).first()
+        wallet_id = _wallet_ids_by_user_id.get(user_id)
+        if wallet_id is not None:
+            wallet = await db.get(Wallet, wallet_id)
+            if wallet:
+                return wallet
+            _wallet_ids_by_user_id.pop(user_id, None)
+
+        wallet = await db.scalar(_WALLET_BY_USER_ID, {"user_id": user_id})
+        if wallet:
+            _wallet_ids_by_user_id[user_id] = wallet.id
+        return wallet
 
     @staticmethod
-    def get_wallet_by_number(db: Session, wallet_number: str) -> Optional[Wallet]:
+    async def get_wallet_by_number(
+        db: AsyncSession, wallet_number: str
+    ) -> Optional[Wallet]:
         """
         Get wallet by wallet number.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             wallet_number (str): 13-digit wallet number.
 
         Returns:
             Optional[Wallet]: Wallet or None if not found.
 
         Examples:
-            >>> wallet = WalletService.get_wallet_by_number(db, "1234567890123")
+            >>> wallet = await WalletService.get_wallet_by_number(db, "1234567890123")
+        """
+        return await db.scalar(_WALLET_BY_NUMBER, {"wallet_number": wallet_number})
+
+    @staticmethod
+    async def batch_fetch_wallets(
+        db: AsyncSession,
+        ids: Sequence[int] = (),
+        numbers: Sequence[str] = (),
+        for_update: bool = False,
+    ) -> List[Wallet]:
+        """
+        Fetch wallets matching any of the given IDs or wallet numbers in one query.
+
+        Args:
+            db (AsyncSession): Database session.
+            ids (Sequence[int]): Wallet IDs to fetch.
+            numbers (Sequence[str]): Wallet numbers to fetch.
+            for_update (bool): Lock the rows (SELECT ... FOR UPDATE) and refresh
+                any already-loaded instances.
+
+        Returns:
+            List[Wallet]: Matching wallets ordered by ID (a wallet matching both an
+            ID and a number is returned once).
+
+        Examples:
+            >>> wallets = await WalletService.batch_fetch_wallets(
+            >>>     db, ids=[1], numbers=["9876543210123"], for_update=True
+            >>> )
+            >>> print(len(wallets))
+            2
+
+        Notes:
+            - Rows are locked in ID order, so two transfers touching the same
+              wallets in opposite directions queue instead of deadlocking.
         """
-        return db.query(Wallet).filter(Wallet.wallet_number == wallet_number).first()
+        stmt = (
+            select(Wallet)
+            .where(or_(Wallet.id.in_(ids), Wallet.wallet_number.in_(numbers)))
+            .order_by(Wallet.id)
+        )
+
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
+
+        result = await db.scalars(stmt)
+        return result.all()
 
     @staticmethod
     def generate_transaction_reference(prefix: str = "DEP") -> str:
@@ -70,26 +218,32 @@ class WalletService:
             prefix (str): Reference prefix (e.g., "DEP", "TRF").
 
         Returns:
-            str: Unique transaction reference.
+            str: Unique transaction reference: prefix + "_" + 26-char ULID.
 
         Examples:
             >>> ref = WalletService.generate_transaction_reference("DEP")
-            >>> print(ref.startswith("DEP_"))
-            True
+            >>> print(ref)
+            'DEP_01JH2Q3W8Z6V4K9RDX5T7M2N0C'
+
+        Notes:
+            - ULID layout: 48-bit millisecond timestamp then 80 random bits,
+              Crockford base32 encoded, so references sort by creation time and
+              inserts land at the right edge of the reference index.
         """
-        timestamp = int(datetime.now(timezone.utc).timestamp())
-        random_str = secrets.token_hex(8)
-        return f"{prefix}_{timestamp}_{random_str}"
+        ulid = time.time_ns() // 1_000_000 << 80 | int.from_bytes(os.urandom(10))
+        return f"{prefix}_" + "".join(
+            [_CROCKFORD_PAIRS[ulid >> shift & 0x3FF] for shift in _ULID_SHIFTS]
+        )
 
     @staticmethod
-    def initialize_paystack_deposit(
-        db: Session, wallet: Wallet, amount: Decimal, user_email: str
+    async def initialize_paystack_deposit(
+        db: AsyncSession, wallet: Wallet, amount: Decimal, user_email: str
     ) -> Dict[str, str]:
         """
         Initialize Paystack deposit transaction.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             wallet (Wallet): User's wallet.
             amount (Decimal): Deposit amount in Naira.
             user_email (str): User's email for Paystack.
@@ -108,47 +262,50 @@ class WalletService:
             'https://checkout.paystack.com/...'
 
         Notes:
-            - Creates pending transaction in database.
+            - Creates pending transaction in database once Paystack accepts it.
             - Converts amount to kobo (multiply by 100).
             - Webhook will update transaction status and credit wallet.
+            - No connection is held during the Paystack call, and a failed call
+              leaves no orphaned pending row behind.
         """
         # Generate unique reference
         reference = WalletService.generate_transaction_reference("DEP")
 
-        # Create pending transaction
-        transaction = Transaction(
-            wallet_id=wallet.id,
-            type="deposit",
-            amount=amount,
-            reference=reference,
-            status="pending",
-            extra_data={"email": user_email},
-        )
-
-        db.add(transaction)
-        db.commit()
-
-        # Initialize Paystack transaction
-        paystack_url = f"{settings.PAYSTACK_BASE_URL}/transaction/initialize"
-        headers = {
-            "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
-            "Content-Type": "application/json",
-        }
+        # End the caller's read transaction so the pooled connection is
+        # returned while we wait on Paystack
+        await db.commit()
 
-        # Convert to kobo (Paystack uses smallest currency unit)
-        amount_in_kobo = int(amount * 100)
+        # Convert to kobo (Paystack uses smallest currency unit); amounts are
+        # validated to 2 decimal places, so the shift is exact
+        amount_in_kobo = int(amount.scaleb(2))
 
         payload = {
             "email": user_email,
             "amount": amount_in_kobo,
             "reference": reference,
-            "callback_url": f"{settings.FRONTEND_URL}/payment/callback",
+            "callback_url": settings.paystack_callback_url,
         }
 
-        response = httpx.post(paystack_url, json=payload, headers=headers)
+        # Initialize Paystack transaction
+        response = await get_paystack_client().post(
+            "/transaction/initialize", json=payload
+        )
         response.raise_for_status()
         data = response.json()
 
+        # Paystack accepted our reference; record the pending transaction
+        await db.execute(
+            insert(Transaction).values(
+                wallet_id=wallet.id,
+                type="deposit",
+                amount=amount,
+                reference=reference,
+                status="pending",
+                extra_data={"email": user_email},
+            )
+        )
+        await db.commit()
+
         return {
             "reference": reference,
             "authorization_url": data["data"]["authorization_url"],
@@ -156,54 +313,138 @@ class WalletService:
         }
 
     @staticmethod
-    def process_successful_deposit(db: Session, reference: str) -> bool:
+    async def process_successful_deposit(db: AsyncSession, reference: str) -> bool:
         """
         Process successful deposit from webhook (idempotent).
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             reference (str): Transaction reference from Paystack.
 
         Returns:
             bool: True if processed successfully, False if already processed.
 
         Examples:
-            >>> success = WalletService.process_successful_deposit(db, "DEP_123_abc")
+            >>> success = await WalletService.process_successful_deposit(db, "DEP_123_abc")
             >>> print(success)
             True
 
         Notes:
             - Idempotent: won't double-credit if called multiple times.
-            - Updates transaction status and wallet balance atomically.
-        """
-        # Get transaction
-        transaction = (
-            db.query(Transaction)
-            .filter(Transaction.reference == reference)
-            .with_for_update()
-            .first()
+            - Updates transaction status and wallet balance atomically in a
+              single UPDATE ... FROM (UPDATE ... RETURNING) statement.
+        """
+        # Flip the transaction to success (idempotency gate) and credit the
+        # wallet in one statement: rows already marked success match nothing.
+        # updated_at is set explicitly since onupdate defaults can't be
+        # rendered for two tables in one statement.
+        credited_txn = (
+            update(Transaction)
+            .where(
+                Transaction.reference == reference,
+                Transaction.status != "success",
+            )
+            .values(status="success", updated_at=func.now())
+            .returning(Transaction.wallet_id, Transaction.amount)
+            .cte("credited_txn")
         )
 
-        if not transaction:
-            return False
+        result = await db.execute(
+            update(Wallet)
+            .where(Wallet.id == credited_txn.c.wallet_id)
+            .values(
+                balance=Wallet.balance + credited_txn.c.amount,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-        # Already processed (idempotency check)
-        if transaction.status == "success":
-            return False
+        await db.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    async def apply_balance_deltas(
+        db: AsyncSession, deltas: Dict[int, Decimal]
+    ) -> bool:
+        """
+        Add signed amounts to several wallet balances in one UPDATE.
+
+        Args:
+            db (AsyncSession): Database session.
+            deltas (Dict[int, Decimal]): Wallet ID to signed amount (negative debits).
+
+        Returns:
+            bool: True if every wallet was updated; False if any debit would take
+            a balance below zero (the caller must roll back).
 
-        # Update transaction status
-        transaction.status = "success"
+        Examples:
+            >>> ok = await WalletService.apply_balance_deltas(
+            >>>     db, {1: Decimal("-3000.00"), 2: Decimal("3000.00")}
+            >>> )
+            >>> if not ok:
+            >>>     raise ValueError("Insufficient balance")
+
+        Notes:
+            - Runs UPDATE wallets ... FROM (VALUES ...) with the balance guard in
+              the WHERE clause, so the check and the write are atomic per row.
+            - Rows that fail the guard are skipped, not rejected; a short rowcount
+              means the other rows were already written and must be rolled back.
+        """
+        balance_deltas = values(
+            column("wallet_id", Integer),
+            column("delta", Numeric(15, 2)),
+            name="balance_deltas",
+        ).data(list(deltas.items()))
+
+        result = await db.execute(
+            update(Wallet)
+            .where(
+                Wallet.id == balance_deltas.c.wallet_id,
+                Wallet.balance + balance_deltas.c.delta >= 0,
+            )
+            .values(balance=Wallet.balance + balance_deltas.c.delta)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == len(deltas)
+
+    @staticmethod
+    async def claim_idempotency_key(
+        db: AsyncSession, key: str, operation: str, user_id: int
+    ) -> bool:
+        """
+        Record an idempotency key, reporting whether it was unused.
 
-        # Credit wallet
-        wallet = db.query(Wallet).filter(Wallet.id == transaction.wallet_id).first()
-        wallet.balance += transaction.amount
+        Args:
+            db (AsyncSession): Database session.
+            key (str): Client-supplied idempotency key.
+            operation (str): Operation type ('transfer', 'deposit', etc.).
+            user_id (int): User who initiated the operation.
+
+        Returns:
+            bool: True if the key was claimed, False if it already exists.
+
+        Examples:
+            >>> if not await WalletService.claim_idempotency_key(db, "uuid-123", "transfer", 1):
+            >>>     raise ValueError("Duplicate transfer request")
 
-        db.commit()
-        return True
+        Notes:
+            - One INSERT ... ON CONFLICT DO NOTHING replaces the SELECT pre-check,
+              so the common (new key) case costs no extra round-trip.
+            - The claim belongs to the caller's transaction: it is released on
+              rollback, and a concurrent request with the same key waits on the
+              row until this one commits or rolls back.
+        """
+        result = await db.execute(
+            pg_insert(IdempotencyKey)
+            .values(key=key, operation=operation, user_id=user_id)
+            .on_conflict_do_nothing(index_elements=[IdempotencyKey.key])
+            .returning(IdempotencyKey.id)
+        )
+        return result.scalar() is not None
 
     @staticmethod
-    def transfer_funds(
-        db: Session,
+    async def transfer_funds(
+        db: AsyncSession,
         sender_wallet: Wallet,
         recipient_wallet_number: str,
         amount: Decimal,
@@ -214,7 +455,7 @@ class WalletService:
         Transfer funds between wallets (atomic operation).
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             sender_wallet (Wallet): Sender's wallet.
             recipient_wallet_number (str): Recipient's wallet number.
             amount (Decimal): Transfer amount.
@@ -228,7 +469,7 @@ class WalletService:
             ValueError: If insufficient balance, invalid recipient, self-transfer, or duplicate idempotency key.
 
         Examples:
-            >>> result = WalletService.transfer_funds(
+            >>> result = await WalletService.transfer_funds(
             >>>     db, sender_wallet, "9876543210123", Decimal("3000.00"), user_id=1, idempotency_key="uuid-123"
             >>> )
             >>> print(result["status"])
@@ -236,25 +477,25 @@ class WalletService:
 
         Notes:
             - Atomic transaction: either both debit and credit succeed, or both fail.
+            - Three statements: one SELECT ... FOR UPDATE for both wallets (in
+              ID order, so opposite-direction transfers cannot deadlock), one
+              balance UPDATE for debit and credit, one INSERT for both
+              transaction records.
+            - The debit is guarded in the UPDATE (balance - amount >= 0), so
+              concurrent transfers cannot overdraw the sender.
             - Creates two transaction records: transfer_out and transfer_in.
             - Prevents self-transfers and duplicate operations via idempotency key.
         """
-        # Check idempotency key if provided
-        if idempotency_key:
-            existing_key = db.query(IdempotencyKey).filter(
-                IdempotencyKey.key == idempotency_key,
-                IdempotencyKey.operation == "transfer"
-            ).first()
-            if existing_key:
-                raise ValueError("Duplicate transfer request")
-
-        # Validate sender balance
-        if sender_wallet.balance < amount:
-            raise ValueError("Insufficient balance")
-
-        # Get recipient wallet
-        recipient_wallet = WalletService.get_wallet_by_number(
-            db, recipient_wallet_number
+        # Fetch and lock sender and recipient in a single round-trip
+        wallets = await WalletService.batch_fetch_wallets(
+            db,
+            ids=[sender_wallet.id],
+            numbers=[recipient_wallet_number],
+            for_update=True,
+        )
+        sender_wallet = next(w for w in wallets if w.id == sender_wallet.id)
+        recipient_wallet = next(
+            (w for w in wallets if w.wallet_number == recipient_wallet_number), None
         )
 
         if not recipient_wallet:
@@ -268,50 +509,48 @@ class WalletService:
         reference = WalletService.generate_transaction_reference("TRF")
 
         try:
-            # Deduct from sender
-            sender_wallet.balance -= amount
-
-            # Add to recipient
-            recipient_wallet.balance += amount
-
-            # Record sender transaction
-            sender_txn = Transaction(
-                wallet_id=sender_wallet.id,
-                type="transfer_out",
-                amount=amount,
-                reference=reference,
-                status="success",
-                extra_data={
-                    "recipient_wallet": recipient_wallet_number,
-                    "recipient_user_id": recipient_wallet.user_id,
-                },
-            )
+            if idempotency_key and not await WalletService.claim_idempotency_key(
+                db, idempotency_key, "transfer", user_id
+            ):
+                raise ValueError("Duplicate transfer request")
 
-            # Record recipient transaction
-            recipient_txn = Transaction(
-                wallet_id=recipient_wallet.id,
-                type="transfer_in",
-                amount=amount,
-                reference=f"{reference}_IN",
-                status="success",
-                extra_data={
-                    "sender_wallet": sender_wallet.wallet_number,
-                    "sender_user_id": sender_wallet.user_id,
-                },
+            # Debit and credit in one statement; the sender row only matches if
+            # the balance covers the amount
+            if not await WalletService.apply_balance_deltas(
+                db, {sender_wallet.id: -amount, recipient_wallet.id: amount}
+            ):
+                raise ValueError("Insufficient balance")
+
+            # Record sender and recipient transactions in one INSERT
+            await db.execute(
+                insert(Transaction),
+                [
+                    {
+                        "wallet_id": sender_wallet.id,
+                        "type": "transfer_out",
+                        "amount": amount,
+                        "reference": reference,
+                        "status": "success",
+                        "extra_data": {
+                            "recipient_wallet": recipient_wallet_number,
+                            "recipient_user_id": recipient_wallet.user_id,
+                        },
+                    },
+                    {
+                        "wallet_id": recipient_wallet.id,
+                        "type": "transfer_in",
+                        "amount": amount,
+                        "reference": f"{reference}_IN",
+                        "status": "success",
+                        "extra_data": {
+                            "sender_wallet": sender_wallet.wallet_number,
+                            "sender_user_id": sender_wallet.user_id,
+                        },
+                    },
+                ],
             )
 
-            db.add(sender_txn)
-            db.add(recipient_txn)
-            
-            # Store idempotency key if provided
-            if idempotency_key:
-                db.add(IdempotencyKey(
-                    key=idempotency_key,
-                    operation="transfer",
-                    user_id=user_id
-                ))
-            
-            db.commit()
+            await db.commit()
 
             return {
                 "status": "success",
@@ -322,62 +561,147 @@ class WalletService:
             }
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise e
 
     @staticmethod
-    def get_transactions(
-        db: Session, wallet_id: int, limit: int = 50, offset: int = 0
-    ) -> List[Transaction]:
+    async def get_transactions(
+        db: AsyncSession,
+        wallet_id: int,
+        limit: int = 50,
+        cursor: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[List[Row], Optional[tuple[datetime, int]]]:
         """
-        Get transaction history for a wallet.
+        Get a page of transaction history for a wallet.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             wallet_id (int): Wallet ID.
             limit (int): Maximum number of transactions to return.
-            offset (int): Number of transactions to skip.
+            cursor (Optional[tuple[datetime, int]]): (created_at, id) of the last
+                transaction on the previous page; None for the first page.
 
         Returns:
-            List[Transaction]: List of transactions ordered by most recent.
+            tuple[List[Row], Optional[tuple[datetime, int]]]: Transaction rows
+                (the TRANSACTION_HISTORY_COLUMNS) ordered by most recent, and the
+                cursor for the next page (None if this is the last page).
 
         Examples:
-            >>> transactions = WalletService.get_transactions(db, wallet_id=1, limit=10)
-            >>> for txn in transactions:
-            >>>     print(f"{txn.type}: {txn.amount}")
-        """
-        return (
-            db.query(Transaction)
-            .filter(Transaction.wallet_id == wallet_id)
-            .order_by(Transaction.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
+            >>> transactions, next_cursor = await WalletService.get_transactions(
+            >>>     db, wallet_id=1, limit=10
+            >>> )
+            >>> older, _ = await WalletService.get_transactions(
+            >>>     db, wallet_id=1, limit=10, cursor=next_cursor
+            >>> )
+            >>> print(older[0].reference)
+            'TRF_01JH2Q3W8Z6V4K9RDX5T7M2N0C'
+
+        Notes:
+            - Keyset pagination on (created_at, id): every page is an index range
+              scan on idx_wallet_created, however deep the history goes.
+            - Returns plain rows rather than ORM instances: history is read-only,
+              so identity-map bookkeeping and unused columns are skipped.
+        """
+        stmt = select(*WalletService.TRANSACTION_HISTORY_COLUMNS).where(
+            Transaction.wallet_id == wallet_id
         )
+        if cursor:
+            stmt = stmt.where(tuple_(Transaction.created_at, Transaction.id) < cursor)
+
+        result = await db.execute(
+            stmt.order_by(Transaction.created_at.desc(), Transaction.id.desc()).limit(
+                limit
+            )
+        )
+        transactions = result.all()
+
+        next_cursor = None
+        if len(transactions) == limit:
+            last = transactions[-1]
+            next_cursor = (last.created_at, last.id)
+
+        return transactions, next_cursor
+
+    @staticmethod
+    def encode_transactions_cursor(cursor: tuple[datetime, int]) -> str:
+        """
+        Encode a get_transactions cursor as a URL-safe string.
+
+        Args:
+            cursor (tuple[datetime, int]): (created_at, id) of the last transaction.
+
+        Returns:
+            str: Cursor string: "<microseconds since epoch>_<transaction id>".
+
+        Examples:
+            >>> WalletService.encode_transactions_cursor((txn.created_at, txn.id))
+            '1736424000000000_42'
+        """
+        created_at, txn_id = cursor
+        micros = (created_at - _EPOCH) // _MICROSECOND
+        return f"{micros}_{txn_id}"
+
+    @staticmethod
+    def decode_transactions_cursor(cursor: str) -> tuple[datetime, int]:
+        """
+        Decode a cursor string produced by encode_transactions_cursor.
+
+        Args:
+            cursor (str): Cursor string from the client.
+
+        Returns:
+            tuple[datetime, int]: (created_at, id) to resume pagination after.
+
+        Raises:
+            ValueError: If the cursor is malformed or its timestamp or id is
+                out of range.
+
+        Examples:
+            >>> WalletService.decode_transactions_cursor("1736424000000000_42")
+            (datetime.datetime(2025, 1, 9, 12, 0, tzinfo=datetime.timezone.utc), 42)
+        """
+        micros, _, txn_id = cursor.partition("_")
+        # int() would also accept "_" separators, whitespace and signs, so
+        # e.g. "1_1_1" would decode to another position instead of failing
+        if not (micros.isascii() and micros.isdigit()):
+            raise ValueError(f"Malformed cursor timestamp: {micros!r}")
+        if not (txn_id.isascii() and txn_id.isdigit()):
+            raise ValueError(f"Malformed cursor id: {txn_id!r}")
+
+        txn_id = int(txn_id)
+        if not 0 < txn_id <= _MAX_TRANSACTION_ID:
+            raise ValueError(f"Cursor id out of range: {txn_id}")
+
+        try:
+            created_at = _EPOCH + int(micros) * _MICROSECOND
+        except OverflowError as e:
+            raise ValueError(f"Cursor timestamp out of range: {micros}") from e
+
+        return created_at, txn_id
 
     @staticmethod
-    def get_transaction_by_reference(
-        db: Session, reference: str
+    async def get_transaction_by_reference(
+        db: AsyncSession, reference: str
     ) -> Optional[Transaction]:
         """
         Get transaction by reference.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             reference (str): Transaction reference.
 
         Returns:
             Optional[Transaction]: Transaction or None if not found.
 
         Examples:
-            >>> txn = WalletService.get_transaction_by_reference(db, "DEP_123_abc")
+            >>> txn = await WalletService.get_transaction_by_reference(db, "DEP_123_abc")
             >>> print(txn.status)
             'success'
         """
-        return db.query(Transaction).filter(Transaction.reference == reference).first()
+        return await db.scalar(_TRANSACTION_BY_REFERENCE, {"reference": reference})
 
     @staticmethod
-    def verify_paystack_transaction(reference: str) -> Dict[str, str]:
+    async def verify_paystack_transaction(reference: str) -> Dict[str, str]:
         """
         Verify transaction status with Paystack API.
 
@@ -391,7 +715,7 @@ class WalletService:
             httpx.HTTPStatusError: If Paystack API call fails.
 
         Examples:
-            >>> result = WalletService.verify_paystack_transaction("DEP_123_abc")
+            >>> result = await WalletService.verify_paystack_transaction("DEP_123_abc")
             >>> print(result["status"])
             'success'
 
@@ -399,28 +723,71 @@ class WalletService:
             - Queries Paystack to check actual payment status.
             - Useful for manual verification if webhook fails.
         """
-        paystack_url = f"{settings.PAYSTACK_BASE_URL}/transaction/verify/{reference}"
-        headers = {
-            "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
-        }
-
-        response = httpx.get(paystack_url, headers=headers)
+        response = await get_paystack_client().get(
+            f"/transaction/verify/{reference}"
+        )
         response.raise_for_status()
         data = response.json()
 
         return {
             "status": data["data"]["status"],
-            "amount": str(data["data"]["amount"] / 100),  # Convert from kobo
+            # Convert from kobo with a decimal shift; no float round-trip
+            "amount": str(Decimal(data["data"]["amount"]).scaleb(-2)),
             "reference": data["data"]["reference"],
         }
 
     @staticmethod
-    def recover_failed_transfer(db: Session, transfer_reference: str) -> bool:
+    async def find_incomplete_transfers(
+        db: AsyncSession, lookback_hours: int = 24, limit: int = 500
+    ) -> List[str]:
+        """
+        Find recent successful transfer_out rows with no successful transfer_in.
+
+        Args:
+            db (AsyncSession): Database session.
+            lookback_hours (int): Only consider transfers created this recently.
+            limit (int): Maximum number of references to return.
+
+        Returns:
+            List[str]: References of transfers that need recovery.
+
+        Examples:
+            >>> for reference in await WalletService.find_incomplete_transfers(db):
+            >>>     await WalletService.recover_failed_transfer(db, reference)
+
+        Notes:
+            - One anti-join query (LEFT JOIN ... WHERE transfer_in.id IS NULL)
+              instead of a per-transfer lookup of the _IN sibling.
+            - The lookback window keeps the scan bounded as history grows; the
+              recovery task runs far more often than the window.
+        """
+        transfer_in = aliased(Transaction)
+        result = await db.scalars(
+            select(Transaction.reference)
+            .outerjoin(
+                transfer_in,
+                (transfer_in.reference == Transaction.reference + "_IN")
+                & (transfer_in.status == "success"),
+            )
+            .where(
+                Transaction.type == "transfer_out",
+                Transaction.status == "success",
+                Transaction.created_at > func.now() - timedelta(hours=lookback_hours),
+                transfer_in.id.is_(None),
+            )
+            .limit(limit)
+        )
+        return result.all()
+
+    @staticmethod
+    async def recover_failed_transfer(
+        db: AsyncSession, transfer_reference: str
+    ) -> bool:
         """
         Recover a failed transfer by rolling back the debit and marking transactions as failed.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             transfer_reference (str): Transfer reference to recover.
 
         Returns:
@@ -430,7 +797,7 @@ class WalletService:
             ValueError: If transfer reference is invalid or recovery fails.
 
         Examples:
-            >>> success = WalletService.recover_failed_transfer(db, "TRF_123_abc")
+            >>> success = await WalletService.recover_failed_transfer(db, "TRF_123_abc")
             >>> print(success)
             True
 
@@ -438,90 +805,111 @@ class WalletService:
             - Only recovers transfers where sender was debited but recipient wasn't credited.
             - Marks both transactions as 'failed' and refunds sender.
             - Idempotent: safe to call multiple times.
+            - One SELECT (transfer_out LEFT JOIN transfer_in), one UPDATE for both
+              transactions and one for the wallet.
         """
-        # Find the transfer_out transaction
-        transfer_out_txn = db.query(Transaction).filter(
-            Transaction.reference == transfer_reference,
-            Transaction.type == "transfer_out",
-            Transaction.status == "success"
+        transfer_in_reference = f"{transfer_reference}_IN"
+
+        # transfer_out and its transfer_in sibling (if any) in one query
+        transfer_in = aliased(Transaction)
+        transfer = (
+            await db.execute(
+                select(Transaction.wallet_id, Transaction.amount, transfer_in.status)
+                .outerjoin(
+                    transfer_in,
+                    (transfer_in.reference == transfer_in_reference)
+                    & (transfer_in.type == "transfer_in"),
+                )
+                .where(
+                    Transaction.reference == transfer_reference,
+                    Transaction.type == "transfer_out",
+                    Transaction.status == "success",
+                )
+            )
         ).first()
 
-        if not transfer_out_txn:
+        if not transfer:
             raise ValueError("Transfer reference not found or not in recoverable state")
 
-        # Check if there's a corresponding transfer_in transaction
-        transfer_in_reference = f"{transfer_reference}_IN"
-        transfer_in_txn = db.query(Transaction).filter(
-            Transaction.reference == transfer_in_reference,
-            Transaction.type == "transfer_in"
-        ).first()
+        sender_wallet_id, amount, transfer_in_status = transfer
 
         # If transfer_in exists and is successful, this transfer completed successfully
-        if transfer_in_txn and transfer_in_txn.status == "success":
-            return False 
+        if transfer_in_status == "success":
+            return False
 
         try:
-            # Get sender wallet and refund the amount
-            sender_wallet = transfer_out_txn.wallet
-            amount = transfer_out_txn.amount
-
-            # Refund sender
-            sender_wallet.balance += amount
-
-            # Mark transfer_out as failed
-            transfer_out_txn.status = "failed"
-            transfer_out_txn.extra_data["recovery_reason"] = "transfer_incomplete"
+            # Mark both legs failed; the status guard makes a concurrent
+            # recovery of the same transfer match nothing
+            marked = await db.execute(
+                update(Transaction)
+                .where(
+                    Transaction.reference.in_(
+                        (transfer_reference, transfer_in_reference)
+                    ),
+                    Transaction.status != "failed",
+                )
+                .values(
+                    status="failed",
+                    extra_data=_merged_extra_data(
+                        recovery_reason="transfer_incomplete"
+                    ),
+                )
+                .returning(Transaction.type)
+                .execution_options(synchronize_session=False)
+            )
+            if "transfer_out" not in marked.scalars().all():
+                await db.rollback()
+                return False
 
-            # If transfer_in exists but failed, update it too
-            if transfer_in_txn:
-                transfer_in_txn.status = "failed"
-                transfer_in_txn.extra_data["recovery_reason"] = "transfer_incomplete"
+            # Refund sender server-side; no wallet read-modify-write
+            await WalletService.apply_balance_deltas(db, {sender_wallet_id: amount})
 
-            db.commit()
+            await db.commit()
             return True
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise ValueError(f"Recovery failed: {str(e)}")
 
     @staticmethod
-    def mark_stale_pending_transactions_as_failed(db: Session, timeout_minutes: int = 30) -> int:
+    async def mark_stale_pending_transactions_as_failed(
+        db: AsyncSession, timeout_minutes: int = 30
+    ) -> int:
         """
         Mark stale pending deposit transactions as failed after timeout.
 
         Args:
-            db (Session): Database session.
+            db (AsyncSession): Database session.
             timeout_minutes (int): Minutes after which pending transactions are considered stale.
 
         Returns:
             int: Number of transactions marked as failed.
 
         Examples:
-            >>> count = WalletService.mark_stale_pending_transactions_as_failed(db, timeout_minutes=60)
+            >>> count = await WalletService.mark_stale_pending_transactions_as_failed(db, timeout_minutes=60)
             >>> print(f"Marked {count} transactions as failed")
 
         Notes:
             - Only affects 'pending' deposit transactions older than timeout.
             - Should be run periodically (e.g., every 5-10 minutes).
+            - Runs as one bulk UPDATE; no rows are loaded into the session.
         """
-        from datetime import datetime, timedelta
-
-        cutoff_time = datetime.utcnow() - timedelta(minutes=timeout_minutes)
-
-        stale_transactions = db.query(Transaction).filter(
-            Transaction.status == "pending",
-            Transaction.type == "deposit",
-            Transaction.created_at < cutoff_time
-        ).all()
-
-        updated_count = 0
-        for txn in stale_transactions:
-            txn.status = "failed"
-            txn.extra_data["failure_reason"] = "timeout"
-            updated_count += 1
-
-        if updated_count > 0:
-            db.commit()
+        cutoff_time = func.now() - timedelta(minutes=timeout_minutes)
+
+        result = await db.execute(
+            update(Transaction)
+            .where(
+                Transaction.status == "pending",
+                Transaction.type == "deposit",
+                Transaction.created_at < cutoff_time,
+            )
+            .values(
+                status="failed",
+                extra_data=_merged_extra_data(failure_reason="timeout"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
 
-        return updated_count
+        return result.rowcount
 
@@ -0,0 +1,160 @@
+"""
+Webhook event queue service.
+
+Handles:
+- Recording inbound webhook events (deduplicated per provider)
+- Applying queued events exactly once
+- Sweeping events left unprocessed (e.g. after a restart)
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.models.user import WebhookEvent
+from app.api.services.wallet_service import WalletService
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookService:
+    """Service for queuing and processing webhook events."""
+
+    @staticmethod
+    async def record_event(
+        db: AsyncSession,
+        provider: str,
+        event_id: str,
+        event: str,
+        payload: Dict[str, Any],
+    ) -> Optional[int]:
+        """
+        Store a webhook event for later processing.
+
+        Args:
+            db (AsyncSession): Database session.
+            provider (str): Sender of the webhook ('paystack').
+            event_id (str): Provider-side identity of the event.
+            event (str): Event type, e.g. 'charge.success'.
+            payload (Dict[str, Any]): Full webhook body.
+
+        Returns:
+            Optional[int]: ID of the new event, or None if it was already recorded.
+
+        Examples:
+            >>> event_id = await WebhookService.record_event(
+            >>>     db, "paystack", "charge.success:DEP_123", "charge.success", data
+            >>> )
+            >>> if event_id is None:
+            >>>     print("Duplicate delivery")
+
+        Notes:
+            - INSERT ... ON CONFLICT DO NOTHING on (provider, event_id), so
+              provider retries are deduplicated without a prior SELECT.
+        """
+        event_pk = await db.scalar(
+            pg_insert(WebhookEvent)
+            .values(
+                provider=provider,
+                event_id=event_id,
+                event=event,
+                payload=payload,
+            )
+            .on_conflict_do_nothing(constraint="uq_webhook_provider_event")
+            .returning(WebhookEvent.id)
+        )
+        await db.commit()
+        return event_pk
+
+    @staticmethod
+    async def process_event(db: AsyncSession, event_pk: int) -> bool:
+        """
+        Apply a queued webhook event.
+
+        Args:
+            db (AsyncSession): Database session.
+            event_pk (int): ID of the WebhookEvent row.
+
+        Returns:
+            bool: True if the event was applied now, False if it was already processed.
+
+        Examples:
+            >>> await WebhookService.process_event(db, 42)
+            True
+
+        Notes:
+            - Claims the event by setting processed_at in the same transaction
+              as the wallet credit, so a crash leaves it queued and concurrent
+              workers cannot both apply it.
+        """
+        claimed = (
+            await db.execute(
+                update(WebhookEvent)
+                .where(
+                    WebhookEvent.id == event_pk,
+                    WebhookEvent.processed_at.is_(None),
+                )
+                .values(processed_at=func.now())
+                .returning(WebhookEvent.event, WebhookEvent.payload)
+            )
+        ).first()
+
+        if not claimed:
+            await db.rollback()
+            return False
+
+        event, payload = claimed
+        if event == "charge.success":
+            # Commits the claim together with the credit
+            await WalletService.process_successful_deposit(
+                db, payload["data"]["reference"]
+            )
+        else:
+            await db.commit()
+
+        return True
+
+    @staticmethod
+    async def process_pending_events(db: AsyncSession, limit: int = 100) -> int:
+        """
+        Apply webhook events that are still queued.
+
+        Args:
+            db (AsyncSession): Database session.
+            limit (int): Maximum number of events to process in one sweep.
+
+        Returns:
+            int: Number of events applied.
+
+        Examples:
+            >>> count = await WebhookService.process_pending_events(db)
+            >>> print(f"Applied {count} queued webhook events")
+
+        Notes:
+            - A failing event is rolled back and logged; it stays queued and
+              the sweep moves on to the events behind it.
+        """
+        pending = (
+            await db.scalars(
+                select(WebhookEvent.id)
+                .where(WebhookEvent.processed_at.is_(None))
+                .order_by(WebhookEvent.id)
+                .limit(limit)
+            )
+        ).all()
+        await db.commit()
+
+        processed_count = 0
+        for event_pk in pending:
+            try:
+                if await WebhookService.process_event(db, event_pk):
+                    processed_count += 1
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error processing webhook event {event_pk}: {e}")
+                continue
+
+        return processed_count
@@ -0,0 +1,98 @@
+"""
+In-process TTL caches for authentication lookups.
+
+Caches the User behind a JWT (by user ID) and the APIKey/User pair behind an API
+key (by key hash) so repeat requests skip the auth SELECT entirely.
+"""
+
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.api.core.config import get_settings
+from app.api.models.user import APIKey, User
+
+settings = get_settings()
+
+_users_by_id: TTLCache = TTLCache(maxsize=10_000, ttl=settings.AUTH_CACHE_TTL)
+_api_keys_by_hash: TTLCache = TTLCache(maxsize=10_000, ttl=settings.AUTH_CACHE_TTL)
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    Get a cached user by ID.
+
+    Args:
+        user_id (int): User ID from the JWT payload.
+
+    Returns:
+        Optional[User]: Detached user, or None on a miss.
+
+    Examples:
+        >>> user = get_cached_user(1)
+        >>> if user is None:
+        >>>     user = await db.get(User, 1)
+    """
+    return _users_by_id.get(user_id)
+
+
+def cache_user(user: User) -> None:
+    """
+    Cache a user loaded for JWT authentication.
+
+    Args:
+        user (User): User loaded in the current session; must be detached by the
+            caller (session.expunge) so a later rollback cannot expire it.
+
+    Examples:
+        >>> db.expunge(user)
+        >>> cache_user(user)
+    """
+    _users_by_id[user.id] = user
+
+
+def get_cached_api_key(key_hash: str) -> Optional[tuple[APIKey, User]]:
+    """
+    Get a cached API key and its owner by key hash.
+
+    Args:
+        key_hash (str): SHA-256 hash of the plain API key.
+
+    Returns:
+        Optional[tuple[APIKey, User]]: Detached key and user, or None on a miss.
+
+    Examples:
+        >>> cached = get_cached_api_key(hash_api_key(x_api_key))
+    """
+    return _api_keys_by_hash.get(key_hash)
+
+
+def cache_api_key(api_key: APIKey, user: User) -> None:
+    """
+    Cache a validated API key and its owner.
+
+    Args:
+        api_key (APIKey): Detached API key.
+        user (User): Detached owner of the key.
+
+    Examples:
+        >>> cache_api_key(api_key, user)
+    """
+    _api_keys_by_hash[api_key.key_hash] = (api_key, user)
+
+
+def invalidate_api_key(key_hash: str) -> None:
+    """
+    Drop a cached API key, e.g. after it is revoked.
+
+    Args:
+        key_hash (str): SHA-256 hash of the plain API key.
+
+    Examples:
+        >>> invalidate_api_key(api_key.key_hash)
+
+    Notes:
+        - Only clears this process's cache; other workers pick up the revocation
+          when their entry expires (AUTH_CACHE_TTL seconds at most).
+    """
+    _api_keys_by_hash.pop(key_hash, None)
@@ -11,12 +11,18 @@ from typing import Optional
 
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.database import get_db
 from app.api.models.user import APIKey, User
 from app.api.services.api_key_service import APIKeyService
-from app.api.utils.security import verify_access_token
+from app.api.utils.auth_cache import (
+    cache_api_key,
+    cache_user,
+    get_cached_api_key,
+    get_cached_user,
+)
+from app.api.utils.security import hash_api_key, verify_access_token
 
 # HTTP Bearer scheme for JWT
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -24,14 +30,14 @@ bearer_scheme = HTTPBearer(auto_error=False)
 
 async def get_current_user_from_jwt(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Optional[User]:
     """
     Extract and validate JWT token, return user if valid.
 
     Args:
         credentials (Optional[HTTPAuthorizationCredentials]): Bearer token from header.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         Optional[User]: Authenticated user or None if no valid JWT.
@@ -45,6 +51,7 @@ async def get_current_user_from_jwt(
     Notes:
         - Does not raise error if no JWT present (allows API key fallback).
         - Returns None if JWT is invalid or user not found.
+        - Users are cached for AUTH_CACHE_TTL seconds, skipping the SELECT on hits.
     """
     if not credentials:
         return None
@@ -59,20 +66,28 @@ async def get_current_user_from_jwt(
     if not user_id:
         return None
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached_user(user_id)
+    if user:
+        return user
+
+    user = await db.get(User, user_id)
+    if user:
+        # Detach so a rollback later in this request can't expire the cached copy
+        db.expunge(user)
+        cache_user(user)
     return user
 
 
 async def get_current_user_from_api_key(
     x_api_key: Optional[str] = Header(None, alias="x-api-key"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Optional[tuple[User, APIKey]]:
     """
     Extract and validate API key, return user and key if valid.
 
     Args:
         x_api_key (Optional[str]): API key from x-api-key header.
-        db (Session): Database session.
+        db (AsyncSession): Database session.
 
     Returns:
         Optional[tuple[User, APIKey]]: User and API key, or None if invalid.
@@ -87,35 +102,46 @@ async def get_current_user_from_api_key(
     Notes:
         - Does not raise error if no API key present.
         - Returns None if API key is invalid, expired, or revoked.
+        - Valid keys are cached by hash for AUTH_CACHE_TTL seconds; revoking a
+          key evicts it.
     """
     if not x_api_key:
         return None
 
-    api_key = APIKeyService.validate_api_key(db, x_api_key)
-
-    if not api_key:
-        return None
+    # Hashed once; the same digest keys the cache and the database lookup
+    key_hash = hash_api_key(x_api_key)
+    cached = get_cached_api_key(key_hash)
+    if cached:
+        api_key, user = cached
+        # Expiry is time-based, so re-check it on every hit
+        return (user, api_key) if api_key.is_valid() else None
 
-    user = db.query(User).filter(User.id == api_key.user_id).first()
+    # Key and owner come back in one joined query
+    api_key = await APIKeyService.validate_api_key(db, x_api_key, key_hash)
 
-    if not user:
+    if not api_key or not api_key.user:
         return None
 
+    user = api_key.user
+    db.expunge(api_key)
+    db.expunge(user)
+    cache_api_key(api_key, user)
+
     return user, api_key
 
 
 async def get_current_user(
-    jwt_user: Optional[User] = Depends(get_current_user_from_jwt),
-    api_key_auth: Optional[tuple[User, APIKey]] = Depends(
-        get_current_user_from_api_key
-    ),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    x_api_key: Optional[str] = Header(None, alias="x-api-key"),
+    db: AsyncSession = Depends(get_db),
 ) -> tuple[User, Optional[APIKey]]:
     """
     Get authenticated user from either JWT or API key.
 
     Args:
-        jwt_user (Optional[User]): User from JWT token.
-        api_key_auth (Optional[tuple]): User and API key from x-api-key header.
+        credentials (Optional[HTTPAuthorizationCredentials]): Bearer token from header.
+        x_api_key (Optional[str]): API key from x-api-key header.
+        db (AsyncSession): Database session.
 
     Returns:
         tuple[User, Optional[APIKey]]: Authenticated user and API key (if used).
@@ -133,13 +159,17 @@ async def get_current_user(
 
     Notes:
         - Prioritizes JWT if both JWT and API key are present.
+        - The API key is only looked up when JWT authentication fails, so each
+          request runs a single auth query.
         - Raises 401 if no valid authentication method found.
     """
     # Try JWT first
+    jwt_user = await get_current_user_from_jwt(credentials, db)
     if jwt_user:
         return jwt_user, None
 
     # Try API key
+    api_key_auth = await get_current_user_from_api_key(x_api_key, db)
     if api_key_auth:
         user, api_key = api_key_auth
         return user, api_key
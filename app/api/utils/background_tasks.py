@@ -7,85 +7,134 @@ handle failed operations, and recover from partial transaction failures.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
-
-from sqlalchemy.orm import Session
+import random
+from typing import Awaitable, Callable
 
 from app.api.core.database import SessionLocal
 from app.api.services.wallet_service import WalletService
+from app.api.services.webhook_service import WebhookService
 
 logger = logging.getLogger(__name__)
 
+# Incomplete transfers fetched and recovered per round trip
+RECOVERY_BATCH_SIZE = 500
+
 
 async def mark_stale_pending_transactions_task():
     """
-    Background task to mark stale pending transactions as failed.
+    Mark stale pending transactions as failed (one run).
 
-    Runs every 5 minutes to clean up transactions that have been pending too long.
-    This prevents accumulation of stuck transactions and ensures users get feedback.
+    Scheduled every 5 minutes to clean up transactions that have been pending too
+    long. This prevents accumulation of stuck transactions and ensures users get
+    feedback.
     """
-    while True:
-        try:
-            with SessionLocal() as db:
-                count = WalletService.mark_stale_pending_transactions_as_failed(
-                    db, timeout_minutes=30
-                )
-                if count > 0:
-                    logger.info(f"Marked {count} stale pending transactions as failed")
-        except Exception as e:
-            logger.error(f"Error in mark_stale_pending_transactions_task: {e}")
-
-        # Run every 5 minutes
-        await asyncio.sleep(300)
+    async with SessionLocal() as db:
+        count = await WalletService.mark_stale_pending_transactions_as_failed(
+            db, timeout_minutes=30
+        )
+        if count > 0:
+            logger.info(f"Marked {count} stale pending transactions as failed")
 
 
 async def detect_and_recover_failed_transfers_task():
     """
-    Background task to detect and recover failed transfer operations.
+    Detect and recover failed transfer operations (one run).
 
-    Runs every 10 minutes to find transfers where sender was debited but recipient
-    wasn't credited, then automatically recovers them.
+    Scheduled every 10 minutes to find transfers where sender was debited but
+    recipient wasn't credited, then automatically recovers them.
+    """
+    async with SessionLocal() as db:
+        recovered_count = 0
+
+        # Drain the backlog one bounded batch at a time; each recovery
+        # commits on its own, so memory stays flat however large it is
+        while True:
+            # Transfers whose transfer_in is missing or not successful
+            references = await WalletService.find_incomplete_transfers(
+                db, limit=RECOVERY_BATCH_SIZE
+            )
+
+            batch_recovered = 0
+            for reference in references:
+                try:
+                    success = await WalletService.recover_failed_transfer(
+                        db, reference
+                    )
+                    if success:
+                        batch_recovered += 1
+                        logger.info(f"Recovered failed transfer: {reference}")
+
+                except Exception as e:
+                    logger.error(f"Error recovering transfer {reference}: {e}")
+                    continue
+
+            recovered_count += batch_recovered
+
+            # A short batch was the last one; a batch with no progress
+            # holds only failing transfers that would be returned again
+            if len(references) < RECOVERY_BATCH_SIZE or not batch_recovered:
+                break
+
+        if recovered_count > 0:
+            logger.info(f"Recovered {recovered_count} failed transfers")
+
+
+async def process_webhook_event(event_pk: int):
+    """
+    Apply one queued webhook event after the webhook has been acknowledged.
+
+    Scheduled by the webhook route as a FastAPI background task; anything that
+    fails here stays queued for process_pending_webhook_events_task.
+    """
+    try:
+        async with SessionLocal() as db:
+            await WebhookService.process_event(db, event_pk)
+    except Exception as e:
+        logger.error(f"Error processing webhook event {event_pk}: {e}")
+
+
+async def process_pending_webhook_events_task():
+    """
+    Apply webhook events left in the queue (one run).
+
+    Scheduled every minute to pick up events whose immediate processing failed or
+    was lost to a restart.
+    """
+    async with SessionLocal() as db:
+        count = await WebhookService.process_pending_events(db)
+        if count > 0:
+            logger.info(f"Applied {count} queued webhook events")
+
+
+async def run_periodically(
+    job: Callable[[], Awaitable[None]], interval: float, jitter: float
+):
+    """
+    Run a job forever, waiting between runs.
+
+    Args:
+        job (Callable[[], Awaitable[None]]): Single-run task coroutine function.
+        interval (float): Seconds to wait after each run.
+        jitter (float): Up to this many extra seconds are added to each wait.
+
+    Examples:
+        >>> asyncio.create_task(
+        >>>     run_periodically(mark_stale_pending_transactions_task, 300, 30)
+        >>> )
+
+    Notes:
+        - The wait starts when a run finishes, so a slow run delays the next one
+          instead of overlapping it.
+        - Jitter keeps several workers from hitting the database in lockstep.
+        - Errors are logged and the schedule continues.
     """
     while True:
         try:
-            with SessionLocal() as db:
-                # Find successful transfer_out transactions
-                transfer_out_txns = db.query(Transaction).filter(
-                    Transaction.type == "transfer_out",
-                    Transaction.status == "success"
-                ).all()
-
-                recovered_count = 0
-                for txn in transfer_out_txns:
-                    try:
-                        # Check if corresponding transfer_in exists and is successful
-                        transfer_in_ref = f"{txn.reference}_IN"
-                        transfer_in_txn = db.query(Transaction).filter(
-                            Transaction.reference == transfer_in_ref
-                        ).first()
-
-                        # If transfer_in doesn't exist or failed, recover
-                        if not transfer_in_txn or transfer_in_txn.status != "success":
-                            success = WalletService.recover_failed_transfer(
-                                db, txn.reference
-                            )
-                            if success:
-                                recovered_count += 1
-                                logger.info(f"Recovered failed transfer: {txn.reference}")
-
-                    except Exception as e:
-                        logger.error(f"Error recovering transfer {txn.reference}: {e}")
-                        continue
-
-                if recovered_count > 0:
-                    logger.info(f"Recovered {recovered_count} failed transfers")
-
+            await job()
         except Exception as e:
-            logger.error(f"Error in detect_and_recover_failed_transfers_task: {e}")
+            logger.error(f"Error in {job.__name__}: {e}")
 
-        # Run every 10 minutes
-        await asyncio.sleep(600)
+        await asyncio.sleep(interval + random.uniform(0, jitter))
 
 
 async def start_background_tasks():
@@ -97,13 +146,16 @@ async def start_background_tasks():
     """
     logger.info("Starting background tasks...")
 
-    # Create tasks
-    task1 = asyncio.create_task(mark_stale_pending_transactions_task())
-    task2 = asyncio.create_task(detect_and_recover_failed_transfers_task())
+    # Create tasks (interval and jitter in seconds)
+    task1 = asyncio.create_task(
+        run_periodically(mark_stale_pending_transactions_task, 300, 30)
+    )
+    task2 = asyncio.create_task(
+        run_periodically(detect_and_recover_failed_transfers_task, 600, 60)
+    )
+    task3 = asyncio.create_task(
+        run_periodically(process_pending_webhook_events_task, 60, 10)
+    )
 
     # Wait for tasks to complete (they run indefinitely)
-    await asyncio.gather(task1, task2)
-
-
-# Import here to avoid circular imports
-from app.api.models.user import Transaction
\ No newline at end of file
+    await asyncio.gather(task1, task2, task3)
@@ -5,15 +5,71 @@ Converts all errors into standardized error responses without exposing
 framework internals or stack traces.
 """
 
+import logging
+from collections import defaultdict
+from functools import lru_cache
+
+import orjson
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.api.utils.response_payload import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+_ERROR_CODES = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    409: "CONFLICT",
+    422: "UNPROCESSABLE_ENTITY",
+    500: "INTERNAL_SERVER_ERROR",
+}
+
+# The 500 body never varies, so it is serialized once
+_GENERIC_500_BODY = orjson.dumps(
+    {
+        "error": "INTERNAL_SERVER_ERROR",
+        "message": "An unexpected error occurred",
+        "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "errors": {},
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _http_error_body(status_code: int, message: str) -> bytes:
+    """
+    Serialize the error body for an HTTP exception.
+
+    Args:
+        status_code (int): HTTP status code of the exception.
+        message (str): Exception detail shown to the client.
+
+    Returns:
+        bytes: JSON body in the standard error format.
+
+    Notes:
+        - HTTPException details are almost always fixed strings (e.g. the 401
+          raised for every bad token), so each distinct body is serialized
+          once and reused.
+    """
+    return orjson.dumps(
+        {
+            "error": _ERROR_CODES.get(status_code, "ERROR"),
+            "message": message,
+            "status_code": status_code,
+            "errors": {},
+        }
+    )
+
 
 def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle Pydantic validation errors.
 
@@ -24,7 +80,7 @@ def validation_exception_handler(
         exc (RequestValidationError): Validation exception from Pydantic.
 
     Returns:
-        JSONResponse: Standardized error response.
+        Response: Standardized error response.
 
     Examples:
         >>> # User sends invalid data:
@@ -44,31 +100,26 @@ def validation_exception_handler(
         - Maps Pydantic error locations to field names.
         - Never exposes internal validation logic.
     """
-    errors = {}
+    errors = defaultdict(list)
 
     for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"][1:])  # Skip 'body' prefix
-        message = error["msg"]
+        field = ".".join(map(str, error["loc"][1:]))  # Skip 'body' prefix
+        errors[field].append(error["msg"])
 
-        if field in errors:
-            errors[field].append(message)
-        else:
-            errors[field] = [message]
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
             "error": "VALIDATION_ERROR",
             "message": "Validation failed",
             "status_code": status.HTTP_400_BAD_REQUEST,
-            "errors": errors,
+            "errors": dict(errors),
         },
     )
 
 
 def http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> Response:
     """
     Handle HTTP exceptions (401, 403, 404, etc.).
 
@@ -79,7 +130,7 @@ def http_exception_handler(
         exc (StarletteHTTPException): HTTP exception.
 
     Returns:
-        JSONResponse: Standardized error response.
+        Response: Standardized error response.
 
     Examples:
         >>> # User tries to access protected endpoint without auth:
@@ -95,31 +146,17 @@ def http_exception_handler(
     Notes:
         - Maps status codes to error codes.
         - Never exposes internal exception details.
+        - Bodies come from _http_error_body, so repeated errors (e.g. a spray
+          of invalid tokens) skip serialization.
     """
-    error_code_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        409: "CONFLICT",
-        422: "UNPROCESSABLE_ENTITY",
-        500: "INTERNAL_SERVER_ERROR",
-    }
-
-    error_code = error_code_map.get(exc.status_code, "ERROR")
-
-    return JSONResponse(
+    return Response(
+        content=_http_error_body(exc.status_code, str(exc.detail)),
         status_code=exc.status_code,
-        content={
-            "error": error_code,
-            "message": str(exc.detail),
-            "status_code": exc.status_code,
-            "errors": {},
-        },
+        media_type="application/json",
     )
 
 
-def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions (500 errors).
 
@@ -130,7 +167,7 @@ def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
         exc (Exception): Any unhandled exception.
 
     Returns:
-        JSONResponse: Standardized error response.
+        Response: Standardized error response.
 
     Examples:
         >>> # Internal server error occurs:
@@ -145,20 +182,13 @@ def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     Notes:
         - NEVER expose exception details in production.
         - Log full exception for debugging.
-        - Return generic message to users.
+        - Return generic message to users (body serialized once at import).
     """
     # Log the full exception for debugging
-    import logging
-
-    logger = logging.getLogger(__name__)
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
-    return JSONResponse(
+    return Response(
+        content=_GENERIC_500_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "INTERNAL_SERVER_ERROR",
-            "message": "An unexpected error occurred",
-            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-            "errors": {},
-        },
+        media_type="application/json",
     )
@@ -1,9 +1,23 @@
 from typing import Dict, List, Optional
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Notes:
+        - Replaces fastapi.responses.ORJSONResponse, which is deprecated in
+          recent FastAPI releases and warns every time it is instantiated.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
 def success_response(status_code: int, message: str, data: Optional[dict] = None):
     """
     Create a standardized JSON response for successful requests.
@@ -14,7 +28,7 @@ def success_response(status_code: int, message: str, data: Optional[dict] = None
         data (Optional[dict]): Optional payload data. Defaults to an empty dict.
 
     Returns:
-        JSONResponse: Contains:
+        ORJSONResponse: Contains:
             - status: "SUCCESS"
             - status_code: same as HTTP status code
             - message: same message passed
@@ -28,7 +42,7 @@ def success_response(status_code: int, message: str, data: Optional[dict] = None
         "data": data or {},
     }
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code, content=jsonable_encoder(response_data)
     )
 
@@ -46,7 +60,7 @@ def auth_response(
         data (Optional[dict]): Additional payload merged into the data block.
 
     Returns:
-        JSONResponse: Same structure as success_response but with:
+        ORJSONResponse: Same structure as success_response but with:
             - access_token added inside the data object
     """
 
@@ -57,7 +71,7 @@ def auth_response(
         "data": {"access_token": access_token, **(data or {})},
     }
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code, content=jsonable_encoder(response_data)
     )
 
@@ -68,7 +82,7 @@ def error_response(
     message: str,
     error: str = "ERROR",
     errors: Optional[Dict[str, List[str]]] = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a standardized JSON response for failed requests.
 
@@ -85,7 +99,7 @@ def error_response(
                 }
 
     Returns:
-        JSONResponse: Standard error structure:
+        ORJSONResponse: Standard error structure:
             {
                 "error": "<ERROR_CODE>",
                 "message": "<message>",
@@ -104,6 +118,6 @@ def error_response(
         "errors": errors or {},
     }
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code, content=jsonable_encoder(response_data)
     )
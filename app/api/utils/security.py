@@ -7,18 +7,45 @@ Provides functions for:
 - Password hashing (if needed in future)
 """
 
+import base64
 import hashlib
 import hmac
-import secrets
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 
 from app.api.core.config import get_settings
 
 settings = get_settings()
 
+# Settings read on every auth call, bound once (settings are fixed per process)
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [settings.ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_API_KEY_PREFIX_BYTES = settings.API_KEY_PREFIX.encode()
+
+# Expiry suffix -> length of one unit (months and years are approximate)
+_EXPIRY_UNITS = {
+    "H": timedelta(hours=1),
+    "D": timedelta(days=1),
+    "M": timedelta(days=30),
+    "Y": timedelta(days=365),
+}
+
+# Keyed once; verify_paystack_signature copies it instead of re-deriving the key pads
+_PAYSTACK_WEBHOOK_HMAC = hmac.new(
+    settings.PAYSTACK_WEBHOOK_SECRET.encode(), digestmod=hashlib.sha512
+)
+
+# token -> decoded payload; a client sends the same bearer token on every
+# request, so signature checks and JSON decoding run once per token per TTL
+_verified_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=settings.AUTH_CACHE_TTL)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -35,49 +62,67 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         >>> token = create_access_token({"sub": "user@example.com", "user_id": 1})
         >>> print(token[:20])
         'eyJhbGciOiJIUzI1NiIs'
+
+    Notes:
+        - exp is written as integer Unix seconds from time.time(), which is
+          how the claim is encoded anyway, so no datetime is built per call.
     """
     to_encode = data.copy()
 
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        ttl_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        ttl_seconds = _ACCESS_TOKEN_TTL_SECONDS
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    to_encode.update({"exp": int(time.time()) + ttl_seconds})
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
 
     return encoded_jwt
 
 
-def verify_access_token(token: str) -> Optional[dict]:
+def verify_access_token(
+    token: str, required_claims: tuple[str, ...] = ("sub", "exp")
+) -> Optional[dict]:
     """
     Verify and decode a JWT access token.
 
     Args:
         token (str): JWT token string to verify.
+        required_claims (tuple[str, ...]): Claims the token must carry, registered
+            or custom (e.g. "sub", "exp", "user_id").
 
     Returns:
-        Optional[dict]: Decoded token payload if valid, None if invalid.
-
-    Raises:
-        JWTError: If token is invalid or expired.
+        Optional[dict]: Decoded token payload if valid, None if invalid, expired
+        or missing a required claim.
 
     Examples:
         >>> payload = verify_access_token(token)
         >>> if payload:
         >>>     user_id = payload.get("user_id")
+
+    Notes:
+        - One verified decode (signature and exp); callers should never
+          pre-decode a token unverified to peek at claims.
+        - Required claims are checked against the payload the same way for
+          fresh decodes and cache hits.
+        - Verified payloads are cached for AUTH_CACHE_TTL seconds; a cached
+          token is still rejected once its exp has passed.
     """
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        return payload
-    except JWTError:
-        return None
+    payload = _verified_tokens.get(token)
+    if payload is not None:
+        # Same rule as jose's decode: exp is enforced only when present
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            _verified_tokens.pop(token, None)
+            return None
+    else:
+        try:
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
+        except JWTError:
+            return None
+        _verified_tokens[token] = payload
+
+    return payload if all(claim in payload for claim in required_claims) else None
 
 
 def generate_api_key() -> str:
@@ -92,10 +137,11 @@ def generate_api_key() -> str:
         >>> print(key.startswith("sk_live_"))
         True
         >>> print(len(key))
-        48
+        51
     """
-    random_part = secrets.token_urlsafe(32)  # 32 bytes = ~43 chars in base64
-    return f"{settings.API_KEY_PREFIX}{random_part}"
+    # 32 random bytes = 43 chars of unpadded URL-safe base64
+    random_part = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=")
+    return (_API_KEY_PREFIX_BYTES + random_part).decode("ascii")
 
 
 def hash_api_key(api_key: str) -> str:
@@ -160,29 +206,16 @@ def parse_expiry_to_datetime(expiry: str) -> datetime:
         >>> parse_expiry_to_datetime("2W")  # Invalid
         ValueError: Invalid expiry format. Use: 1H, 1D, 1M, 1Y
     """
-    valid_formats = {"H": "hours", "D": "days", "M": "months", "Y": "years"}
-
-    if len(expiry) < 2 or expiry[-1] not in valid_formats:
+    unit = _EXPIRY_UNITS.get(expiry[-1:])
+    if unit is None:
         raise ValueError("Invalid expiry format. Use: 1H, 1D, 1M, 1Y")
 
     try:
         quantity = int(expiry[:-1])
-        unit = expiry[-1]
     except ValueError:
         raise ValueError("Invalid expiry format. Use: 1H, 1D, 1M, 1Y")
 
-    now = datetime.now(timezone.utc)
-
-    if unit == "H":
-        return now + timedelta(hours=quantity)
-    elif unit == "D":
-        return now + timedelta(days=quantity)
-    elif unit == "M":
-        return now + timedelta(days=quantity * 30)  # Approximate month
-    elif unit == "Y":
-        return now + timedelta(days=quantity * 365)  # Approximate year
-
-    raise ValueError("Invalid expiry format. Use: 1H, 1D, 1M, 1Y")
+    return datetime.now(timezone.utc) + quantity * unit
 
 
 def verify_paystack_signature(payload: bytes, signature: str) -> bool:
@@ -204,9 +237,9 @@ def verify_paystack_signature(payload: bytes, signature: str) -> bool:
     Notes:
         - Always validate webhooks to prevent spoofing attacks.
         - Use constant-time comparison to prevent timing attacks.
+        - Copies a pre-keyed HMAC-SHA512 object, so each call only hashes the payload.
     """
-    computed_signature = hmac.new(
-        settings.PAYSTACK_WEBHOOK_SECRET.encode(), payload, hashlib.sha512
-    ).hexdigest()
+    mac = _PAYSTACK_WEBHOOK_HMAC.copy()
+    mac.update(payload)
 
-    return hmac.compare_digest(computed_signature, signature)
+    return hmac.compare_digest(mac.hexdigest(), signature)
@@ -4,30 +4,40 @@ FastAPI application entry point.
 Initializes the FastAPI app, registers routes, and configures exception handlers.
 """
 
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.core.config import get_settings
+from app.api.core.database import engine
+from app.api.core.http_client import (
+    close_http_client,
+    get_http_client,
+    get_paystack_client,
+)
+from app.api.models import Base
 from app.api.routes import api_keys, auth, wallet
+from app.api.utils.background_tasks import start_background_tasks
 from app.api.utils.exception_handlers import (
     generic_exception_handler,
     http_exception_handler,
     validation_exception_handler,
 )
+from app.api.utils.response_payload import ORJSONResponse
 
-from contextlib import asynccontextmanager
-from app.api.core.database import engine
-from app.api.models import Base
-from app.api.utils.background_tasks import start_background_tasks
-import asyncio
-import logging
-
-try:
+# Re-reading .env is opt-in; otherwise every module shares the cached
+# Settings that was built when the first of them was imported
+if os.environ.get("RELOAD_SETTINGS") == "1":
     get_settings.cache_clear()
-except AttributeError:
-    pass
 
 settings = get_settings()
 
@@ -42,20 +52,6 @@ def _mask_value(value: str, prefix: int = 8, suffix: int = 6) -> str:
     return f"{value[:prefix]}...{value[-suffix:]}"
 
 
-# Only raise error for actual placeholder strings
-if settings.GOOGLE_CLIENT_ID and (
-    settings.GOOGLE_CLIENT_ID == "your-google-client-id.apps.googleusercontent.com"
-    or settings.GOOGLE_CLIENT_ID == "your-client-id.apps.googleusercontent.com"
-    or settings.GOOGLE_CLIENT_ID.startswith("your-")
-):
-    logger.warning(
-        "Detected placeholder Google client id. Make sure GOOGLE_CLIENT_ID is set in your environment or .env file."
-    )
-    if settings.DEBUG:
-        raise RuntimeError(
-            "GOOGLE_CLIENT_ID is a placeholder. Set your real client ID in environment or .env before starting the app."
-        )
-
 logger.info(
     "Google OAuth: client_id=%s redirect_uri=%s",
     _mask_value(settings.GOOGLE_CLIENT_ID),
@@ -65,8 +61,16 @@ logger.info(
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create tables synchronously
-    Base.metadata.create_all(engine)
+    # Create tables (inspects every table, so skip it when migrations own the schema)
+    if settings.DB_CREATE_TABLES:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    else:
+        logger.info("Skipping create_all; schema is managed by migrations")
+
+    # Open the shared outbound HTTP clients (Google, Paystack)
+    get_http_client()
+    get_paystack_client()
 
     # Start background tasks
     background_task = asyncio.create_task(start_background_tasks())
@@ -80,6 +84,9 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    # Release pooled outbound connections
+    await close_http_client()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -88,6 +95,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -97,6 +105,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so CORS headers are set before the body is compressed; small
+# bodies (most wallet responses) skip compression entirely
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
@@ -108,21 +119,30 @@ app.include_router(api_keys.router, prefix=settings.API_V1_PREFIX)
 app.include_router(wallet.router, prefix=settings.API_V1_PREFIX)
 
 
+# Constant bodies for the root and health endpoints, serialized once. A fresh
+# Response is built per request: middleware (CORS) edits response headers in
+# place, so a shared Response instance would accumulate them.
+_ROOT_BODY = orjson.dumps(
+    {
+        "message": "Wallet Service API",
+        "version": "1.0.0",
+        "status": "operational",
+        "docs": "/docs",
+    }
+)
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/")
 async def root():
     """
     Root endpoint for health check.
 
     Returns:
-        dict: Basic API information.
+        Response: Basic API information.
 
     """
-    return {
-        "message": "Wallet Service API",
-        "version": "1.0.0",
-        "status": "operational",
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -131,17 +151,26 @@ async def health_check():
     Health check endpoint for monitoring.
 
     Returns:
-        dict: Service health status.
+        Response: Service health status.
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http "auto" select uvloop and httptools when installed (they ship
+    # with uvicorn[standard]) and fall back to asyncio/h11, e.g. on Windows
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=settings.APP_PORT,
         reload=settings.DEBUG,
+        # Each worker opens up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+        # and runs its own background tasks; raise APP_WORKERS only with the
+        # pool sized so workers * (pool + overflow) fits max_connections
+        workers=None if settings.DEBUG else settings.APP_WORKERS,
+        loop="auto",
+        http="auto",
+        log_level="info" if settings.DEBUG else "warning",
     )